@@ -1,6 +1,7 @@
 """Article summarization using Gemini API."""
 
 import os
+import threading
 
 from fastapi import HTTPException
 from google import genai
@@ -8,6 +9,31 @@ from google.genai import types
 
 from .config import get_summarization_prompt_template
 
+SUMMARIZATION_MODEL = "gemini-2.0-flash-exp"
+
+# Generation settings are identical for every request, so build them once
+SUMMARIZATION_CONFIG = types.GenerateContentConfig(
+    temperature=0.3,  # Lower temperature for more focused summaries
+    max_output_tokens=150,  # Limit summary length
+)
+
+# Cache the Gemini client at module level so its HTTP connection pool is reused
+_GEMINI_CLIENT: genai.Client | None = None
+_GEMINI_CLIENT_API_KEY: str | None = None
+# Summaries run in worker threads; without the lock concurrent first calls
+# would each build a client, leaking all but the last
+_GEMINI_CLIENT_LOCK = threading.Lock()
+
+
+def get_gemini_client(api_key: str) -> genai.Client:
+    """Get the shared Gemini client, recreating it if the API key changed."""
+    global _GEMINI_CLIENT, _GEMINI_CLIENT_API_KEY
+    with _GEMINI_CLIENT_LOCK:
+        if _GEMINI_CLIENT is None or _GEMINI_CLIENT_API_KEY != api_key:
+            _GEMINI_CLIENT = genai.Client(api_key=api_key)
+            _GEMINI_CLIENT_API_KEY = api_key
+        return _GEMINI_CLIENT
+
 
 def summarize_with_gemini(article_text: str) -> str:
     """
@@ -27,8 +53,7 @@ def summarize_with_gemini(article_text: str) -> str:
         raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured")
 
     try:
-        client = genai.Client(api_key=api_key)
-        model = "gemini-2.0-flash-exp"
+        client = get_gemini_client(api_key)
 
         # Load prompt template from config and format with article text
         prompt_template = get_summarization_prompt_template()
@@ -41,14 +66,9 @@ def summarize_with_gemini(article_text: str) -> str:
             )
         ]
 
-        generate_content_config = types.GenerateContentConfig(
-            temperature=0.3,  # Lower temperature for more focused summaries
-            max_output_tokens=150,  # Limit summary length
-        )
-
         # Use synchronous call for web handler
         result = client.models.generate_content(
-            model=model, contents=contents, config=generate_content_config
+            model=SUMMARIZATION_MODEL, contents=contents, config=SUMMARIZATION_CONFIG
         )
 
         summary_text = (result.text or "").strip()
@@ -2,7 +2,7 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 
 from ..db.sqlalchemy import get_session
 from ..models.sqlalchemy_models import Article, BiasRating
@@ -13,7 +13,14 @@ from fastapi import Header, HTTPException
 import os
 from ..worker.news_worker import NewsWorker
 
-@router.get("/fetch")
+class FetchResponse(BaseModel):
+    """Response after a manually triggered fetch"""
+
+    status: str
+    fetched: int
+
+
+@router.get("/fetch", response_model=FetchResponse)
 async def trigger_fetch(
     authorization: str | None = Header(default=None),
     use_newsapi: bool = Query(default=False),
@@ -33,8 +40,12 @@ async def trigger_fetch(
         raise HTTPException(status_code=401, detail="Unauthorized")
 
     worker = NewsWorker(limit=limit)
-    count = await worker.run_single_fetch(use_cnn=use_cnn, use_newsapi=use_newsapi)
-    return {"status": "ok", "fetched": count}
+    try:
+        count = await worker.run_single_fetch(use_cnn=use_cnn, use_newsapi=use_newsapi)
+    finally:
+        # Release the worker's pooled HTTP client and its sockets
+        await worker.aclose()
+    return FetchResponse(status="ok", fetched=count)
 
 
 
@@ -129,9 +140,14 @@ async def get_latest_articles(
     if max_bias_score is not None:
         query = query.filter(BiasRating.bias_score <= max_bias_score)
 
-    # Get articles with pagination
+    # Get articles with pagination; bias ratings are batch-loaded and any other
+    # relationship access raises instead of issuing a query per article
     articles = (
-        query.order_by(Article.created_at.desc()).offset(offset).limit(limit).all()
+        query.options(selectinload(Article.bias_ratings), raiseload("*"))
+        .order_by(Article.created_at.desc(), Article.article_id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
     )
 
     # Build response with bias rating info
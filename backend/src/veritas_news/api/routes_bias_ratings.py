@@ -1,7 +1,12 @@
+import asyncio
+from collections import OrderedDict
+import hashlib
 import json
+import os
+import time
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from loguru import logger
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
@@ -17,6 +22,45 @@ from ..models.sqlalchemy_models import Article, BiasRating
 
 router = APIRouter()
 
+# Error details for /summarize, shared across requests
+EMPTY_ARTICLE_TEXT_DETAIL = "Article text is required and cannot be empty"
+EMPTY_SUMMARY_DETAIL = "Summarization returned empty summary"
+
+# /summarize_batch limits: texts per request and Gemini calls in flight at once
+SUMMARIZE_BATCH_MAX = 50
+SUMMARIZE_BATCH_CONCURRENCY = 8
+
+# Bounded TTL cache for /summarize, keyed by a hash of the article text
+SUMMARY_CACHE_MAXSIZE = 1024
+SUMMARY_CACHE_TTL_SECONDS = 3600
+_summary_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+
+def _summary_cache_key(article_text: str) -> str:
+    """Hash article text into a compact cache key"""
+    return hashlib.blake2b(article_text.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_summary(key: str) -> str | None:
+    """Return a cached summary if present and not expired (LRU touch on hit)"""
+    entry = _summary_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, summary = entry
+    if expires_at <= time.monotonic():
+        del _summary_cache[key]
+        return None
+    _summary_cache.move_to_end(key)
+    return summary
+
+
+def _cache_summary(key: str, summary: str) -> None:
+    """Store a summary, evicting the least recently used entry when full"""
+    _summary_cache[key] = (time.monotonic() + SUMMARY_CACHE_TTL_SECONDS, summary)
+    _summary_cache.move_to_end(key)
+    if len(_summary_cache) > SUMMARY_CACHE_MAXSIZE:
+        _summary_cache.popitem(last=False)
+
 
 class SummarizeRequest(BaseModel):
     """Request to summarize article text"""
@@ -24,6 +68,24 @@ class SummarizeRequest(BaseModel):
     article_text: str
 
 
+class SummarizeResponse(BaseModel):
+    """Response containing the generated summary"""
+
+    summary: str
+
+
+class SummarizeBatchRequest(BaseModel):
+    """Request to summarize several article texts in one call"""
+
+    article_texts: list[str]
+
+
+class SummarizeBatchResponse(BaseModel):
+    """Summaries in request order; None where summarization failed"""
+
+    summaries: list[str | None]
+
+
 class AnalyzeArticleRequest(BaseModel):
     """Request to analyze an article for bias"""
 
@@ -219,15 +281,21 @@ async def analyze_article_bias(
         )
 
 
-@router.post("/summarize")
-async def summarize_article(request: SummarizeRequest):
+@router.post("/summarize", response_model=SummarizeResponse)
+async def summarize_article(
+    request: SummarizeRequest,
+    x_no_cache: str | None = Header(default=None),
+):
     """
     Summarize article text using the AI library.
 
     This endpoint validates the input and calls the summarization function directly.
+    Summaries are cached by article text for SUMMARY_CACHE_TTL_SECONDS; send an
+    X-No-Cache header to bypass the cached copy.
 
     Args:
         request: Contains article_text to summarize
+        x_no_cache: Optional X-No-Cache header to force a fresh summary
 
     Returns:
         Dictionary with 'summary' key containing the summarized text
@@ -236,22 +304,27 @@ async def summarize_article(request: SummarizeRequest):
         HTTPException: 422 for invalid input, 500/502 for errors
     """
     # Validate article text
-    if not request.article_text or not request.article_text.strip():
-        raise HTTPException(
-            status_code=422, detail="Article text is required and cannot be empty"
-        )
+    if not request.article_text.strip():
+        raise HTTPException(status_code=422, detail=EMPTY_ARTICLE_TEXT_DETAIL)
+
+    cache_key = _summary_cache_key(request.article_text)
+    if x_no_cache is None:
+        cached_summary = _get_cached_summary(cache_key)
+        if cached_summary is not None:
+            logger.debug("Returning cached summary")
+            return SummarizeResponse(summary=cached_summary)
 
     try:
         logger.info("Calling summarization function")
         summary = summarize_with_gemini(request.article_text)
 
-        if not summary or not summary.strip():
+        # summarize_with_gemini returns stripped text, so a falsy check suffices
+        if not summary:
             logger.error("Summarization function returned empty summary")
-            raise HTTPException(
-                status_code=502, detail="Summarization returned empty summary"
-            )
+            raise HTTPException(status_code=502, detail=EMPTY_SUMMARY_DETAIL)
 
-        return {"summary": summary}
+        _cache_summary(cache_key, summary)
+        return SummarizeResponse(summary=summary)
 
     except HTTPException:
         # Re-raise HTTP exceptions (e.g., 500/502 from summarize_with_gemini)
@@ -261,3 +334,74 @@ async def summarize_article(request: SummarizeRequest):
         raise HTTPException(
             status_code=500, detail=f"Failed to summarize article: {str(e)}"
         )
+
+
+@router.post("/summarize_batch", response_model=SummarizeBatchResponse)
+async def summarize_articles(
+    request: SummarizeBatchRequest,
+    x_no_cache: str | None = Header(default=None),
+):
+    """
+    Summarize up to SUMMARIZE_BATCH_MAX article texts in one request.
+
+    Texts are summarized concurrently (at most SUMMARIZE_BATCH_CONCURRENCY
+    Gemini calls at a time) and share the /summarize cache. A text that fails
+    to summarize gets None instead of failing the whole batch.
+
+    Args:
+        request: Contains the article_texts to summarize
+        x_no_cache: Optional X-No-Cache header to force fresh summaries
+
+    Returns:
+        Dictionary with 'summaries' in the same order as article_texts
+
+    Raises:
+        HTTPException: 422 for invalid input, 500 if summarization is not configured
+    """
+    texts = request.article_texts
+    if not texts or len(texts) > SUMMARIZE_BATCH_MAX:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Between 1 and {SUMMARIZE_BATCH_MAX} article texts are required",
+        )
+    if any(not text.strip() for text in texts):
+        raise HTTPException(status_code=422, detail=EMPTY_ARTICLE_TEXT_DETAIL)
+
+    # A missing API key fails every text; report it before starting any calls
+    if not os.environ.get("GEMINI_API_KEY"):
+        raise HTTPException(status_code=500, detail="GEMINI_API_KEY not configured")
+
+    # Identical texts in one batch are summarized once
+    keys = [_summary_cache_key(text) for text in texts]
+    unique_texts = dict(zip(keys, texts))
+    semaphore = asyncio.Semaphore(SUMMARIZE_BATCH_CONCURRENCY)
+
+    async def summarize_one(key: str, text: str) -> str | None:
+        if x_no_cache is None:
+            cached_summary = _get_cached_summary(key)
+            if cached_summary is not None:
+                return cached_summary
+        async with semaphore:
+            try:
+                summary = await asyncio.to_thread(summarize_with_gemini, text)
+            except HTTPException as e:
+                logger.warning(f"Batch summarization failed for one article: {e.detail}")
+                return None
+            except Exception as e:
+                logger.warning(f"Batch summarization failed for one article: {e}")
+                return None
+        if summary:
+            _cache_summary(key, summary)
+            return summary
+        return None
+
+    logger.info(f"Summarizing batch of {len(texts)} articles")
+    # summarize_one turns every failure into None, so one text never cancels
+    # the rest of the group
+    async with asyncio.TaskGroup() as tg:
+        tasks = {
+            key: tg.create_task(summarize_one(key, text))
+            for key, text in unique_texts.items()
+        }
+    summary_by_key = {key: task.result() for key, task in tasks.items()}
+    return SummarizeBatchResponse(summaries=[summary_by_key[key] for key in keys])
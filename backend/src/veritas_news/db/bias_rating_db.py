@@ -2,24 +2,52 @@ from datetime import datetime
 from sqlite3 import Connection
 from typing import Any
 
+# Upper bound on the number of rows returned by get_all_bias_ratings
+MAX_PAGE_SIZE = 1000
+
+# One fixed UPDATE statement per (bias_score set, reasoning set) combination so
+# sqlite3's statement cache sees the same SQL text on every call
+_UPDATE_BIAS_RATING_QUERIES: dict[tuple[bool, bool], str] = {
+    (True, False): """
+    UPDATE bias_ratings
+    SET bias_score = ?, evaluated_at = CURRENT_TIMESTAMP
+    WHERE rating_id = ?
+    """,
+    (False, True): """
+    UPDATE bias_ratings
+    SET reasoning = ?, evaluated_at = CURRENT_TIMESTAMP
+    WHERE rating_id = ?
+    """,
+    (True, True): """
+    UPDATE bias_ratings
+    SET bias_score = ?, reasoning = ?, evaluated_at = CURRENT_TIMESTAMP
+    WHERE rating_id = ?
+    """,
+}
+
 
 def dict_factory(cursor, row):
     """Convert sqlite row to dictionary"""
     return {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
 
 
-def get_all_bias_ratings(conn: Connection) -> list[dict[str, Any]]:
+def get_all_bias_ratings(
+    conn: Connection, limit: int = 100, offset: int = 0
+) -> list[dict[str, Any]]:
     """
-    Retrieve all bias ratings from the database
+    Retrieve a page of bias ratings from the database, newest first
 
     Args:
         conn: Database connection
+        limit: Maximum number of ratings to return (clamped to 1..MAX_PAGE_SIZE)
+        offset: Number of ratings to skip (negative values are treated as 0)
 
     Returns:
         List of bias rating dictionaries
     """
-    conn.row_factory = dict_factory
     cursor = conn.cursor()
+    # Plain tuple rows; column names are read once below rather than per row
+    cursor.row_factory = None
 
     query = """
     SELECT
@@ -30,10 +58,14 @@ def get_all_bias_ratings(conn: Connection) -> list[dict[str, Any]]:
         evaluated_at
     FROM bias_ratings
     ORDER BY evaluated_at DESC
+    LIMIT ? OFFSET ?
     """
 
-    cursor.execute(query)
-    results = cursor.fetchall()
+    # SQLite treats a negative LIMIT as unbounded, so clamp both ends
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    cursor.execute(query, (limit, max(0, offset)))
+    columns = [col[0] for col in cursor.description]
+    results = [dict(zip(columns, row)) for row in cursor.fetchall()]
 
     # Convert datetime strings to datetime objects if needed
     for rating in results:
@@ -51,6 +83,23 @@ def get_all_bias_ratings(conn: Connection) -> list[dict[str, Any]]:
     return results
 
 
+def count_bias_ratings(conn: Connection) -> int:
+    """
+    Count all bias ratings without materializing them
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Total number of bias ratings
+    """
+    cursor = conn.cursor()
+    # Plain tuple rows regardless of any row_factory left on the connection
+    cursor.row_factory = None
+    cursor.execute("SELECT COUNT(*) FROM bias_ratings")
+    return cursor.fetchone()[0]
+
+
 def get_bias_rating_by_id(conn: Connection, rating_id: int) -> dict[str, Any] | None:
     """
     Retrieve a single bias rating by ID
@@ -62,8 +111,9 @@ def get_bias_rating_by_id(conn: Connection, rating_id: int) -> dict[str, Any] |
     Returns:
         Bias rating dictionary or None if not found
     """
-    conn.row_factory = dict_factory
     cursor = conn.cursor()
+    # Set on the cursor so the caller's connection keeps its own row_factory
+    cursor.row_factory = dict_factory
 
     query = """
     SELECT
@@ -111,35 +161,16 @@ def update_bias_rating(
     Returns:
         True if update was successful, False if rating not found
     """
-    cursor = conn.cursor()
-
-    # Build dynamic update query based on provided fields
-    update_fields = []
-    params = []
-
-    if bias_score is not None:
-        update_fields.append("bias_score = ?")
-        params.append(bias_score)
+    query = _UPDATE_BIAS_RATING_QUERIES.get((bias_score is not None, reasoning is not None))
 
-    if reasoning is not None:
-        update_fields.append("reasoning = ?")
-        params.append(reasoning)
-
-    if not update_fields:
-        # No fields to update
+    if query is None:
+        # Empty patch: skip the write entirely so evaluated_at is not bumped
         return True
 
-    # Always update the evaluated_at timestamp
-    update_fields.append("evaluated_at = CURRENT_TIMESTAMP")
-
+    params = [value for value in (bias_score, reasoning) if value is not None]
     params.append(rating_id)
 
-    query = f"""
-    UPDATE bias_ratings
-    SET {', '.join(update_fields)}
-    WHERE rating_id = ?
-    """
-
+    cursor = conn.cursor()
     cursor.execute(query, params)
     conn.commit()
 
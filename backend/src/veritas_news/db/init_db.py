@@ -1,6 +1,10 @@
 """
 Database initialization module using SQLAlchemy.
 This replaces the old sqlite3-based init_db implementation.
+
+All database access (ORM sessions and the raw sqlite3-style helpers) goes
+through the single engine defined in db/sqlalchemy.py so every code path
+reads and writes the same DB_PATH file.
 """
 
 from collections.abc import Generator
@@ -8,6 +12,7 @@ from contextlib import contextmanager
 
 from loguru import logger
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import PoolProxiedConnection
 
 from .sqlalchemy import Base, SessionLocal, engine
 
@@ -30,6 +35,20 @@ def get_connection() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_raw_connection() -> PoolProxiedConnection:
+    """
+    Get a raw DB-API connection from the shared SQLAlchemy engine.
+
+    Used by the code that issues plain SQL (worker pipeline, migrations) instead
+    of opening its own sqlite3 connection, so it shares the same database file
+    and connection pool as the ORM. Calling close() returns it to the pool.
+
+    Returns:
+        Pooled DB-API connection proxy
+    """
+    return engine.raw_connection()
+
+
 def init_db(db: Session = None) -> bool:
     """
     Initialize the database with required tables using SQLAlchemy.
@@ -42,6 +61,7 @@ def init_db(db: Session = None) -> bool:
     """
     try:
         # Import all models to ensure they're registered with Base.metadata
+        from ..models import sqlalchemy_models  # noqa: F401
 
         # Create all tables defined in the models
         Base.metadata.create_all(bind=engine)
@@ -50,3 +70,8 @@ def init_db(db: Session = None) -> bool:
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
         return False
+
+
+if __name__ == "__main__":
+    # One-shot table creation, run before starting the API with DB_INIT_ON_STARTUP=false
+    raise SystemExit(0 if init_db() else 1)
@@ -0,0 +1,65 @@
+"""
+Migration: Add composite/query indexes to existing databases.
+
+Base.metadata.create_all only creates indexes together with new tables, so
+databases created before these indexes were declared on the models need
+them added explicitly:
+- ix_articles_title: duplicate-title check in the worker pipeline
+- ix_articles_published_at: articles ordered/filtered by publication date
+- ix_articles_created_at: newest-first article listings
+- ix_articles_source_created: per-source article counts and latest article
+- ix_bias_ratings_article_evaluated: latest bias rating for an article
+- ix_user_interactions_user_interacted: recent interactions by a user
+- ix_user_interactions_article_interacted: recent interactions on an article
+
+Uses CREATE INDEX IF NOT EXISTS, so it is safe to run repeatedly.
+"""
+
+import sqlite3
+
+from ..init_db import get_raw_connection
+
+INDEXES = {
+    "ix_articles_title": "articles (title)",
+    "ix_articles_published_at": "articles (published_at)",
+    "ix_articles_created_at": "articles (created_at)",
+    "ix_articles_source_created": "articles (source, created_at)",
+    "ix_bias_ratings_article_evaluated": "bias_ratings (article_id, evaluated_at)",
+    "ix_user_interactions_user_interacted": "user_interactions (user_id, interacted_at)",
+    "ix_user_interactions_article_interacted": "user_interactions (article_id, interacted_at)",
+}
+
+
+def run_migration(db_path: str | None = None) -> bool:
+    """
+    Create the query indexes declared on the models if they are missing.
+
+    Args:
+        db_path: Path to SQLite database file (defaults to the application
+            database configured via DB_PATH / SQLALCHEMY_DATABASE_URL)
+
+    Returns:
+        True if migration successful, False otherwise
+    """
+    try:
+        conn = sqlite3.connect(db_path) if db_path else get_raw_connection()
+        cursor = conn.cursor()
+
+        for name, target in INDEXES.items():
+            print(f"Ensuring index {name}")
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+
+        conn.commit()
+        conn.close()
+
+        print("✓ Migration completed successfully")
+        return True
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    # Run migration on the application database
+    run_migration()
@@ -12,19 +12,22 @@ All columns are nullable to support gradual migration and backward compatibility
 
 import sqlite3
 
+from ..init_db import get_raw_connection
 
-def run_migration(db_path: str = "veritas_news.db") -> bool:
+
+def run_migration(db_path: str | None = None) -> bool:
     """
     Add SECM columns to bias_ratings table.
     
     Args:
-        db_path: Path to SQLite database file
+        db_path: Path to SQLite database file (defaults to the application
+            database configured via DB_PATH / SQLALCHEMY_DATABASE_URL)
         
     Returns:
         True if migration successful, False otherwise
     """
     try:
-        conn = sqlite3.connect(db_path)
+        conn = sqlite3.connect(db_path) if db_path else get_raw_connection()
         cursor = conn.cursor()
         
         # Check if migration already applied
@@ -117,7 +120,7 @@ def run_migration(db_path: str = "veritas_news.db") -> bool:
 
 
 if __name__ == "__main__":
-    # Run migration on default database
+    # Run migration on the application database
     run_migration()
 
 
@@ -0,0 +1,124 @@
+"""
+Migration: Store user_interactions.action as a small integer.
+
+Earlier schemas stored the action as TEXT with
+CHECK (action IN ('viewed', 'liked', 'bookmarked')). The model now stores
+InteractionAction codes (1 = viewed, 2 = liked, 3 = bookmarked) in a
+SMALLINT column with CHECK (action BETWEEN 1 AND 3).
+
+SQLite cannot change a column's type or CHECK in place, so the table is
+rebuilt: the old table is renamed, the new one is created from the model,
+rows are copied with the string actions mapped to their codes, and the old
+table is dropped.
+"""
+
+import sqlite3
+
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from ...models.sqlalchemy_models import UserInteraction
+from ..init_db import get_raw_connection
+
+
+def run_migration(db_path: str | None = None) -> bool:
+    """
+    Convert user_interactions.action from TEXT to InteractionAction codes.
+
+    Args:
+        db_path: Path to SQLite database file (defaults to the application
+            database configured via DB_PATH / SQLALCHEMY_DATABASE_URL)
+
+    Returns:
+        True if migration successful, False otherwise
+    """
+    conn = None
+    dbapi_conn = None
+    isolation_level = None
+    try:
+        conn = sqlite3.connect(db_path) if db_path else get_raw_connection()
+        # Pooled connections wrap the sqlite3 connection; manage its
+        # transactions directly so the DDL below cannot autocommit piecemeal
+        dbapi_conn = conn if db_path else conn.dbapi_connection
+        isolation_level = dbapi_conn.isolation_level
+        dbapi_conn.isolation_level = None
+        cursor = dbapi_conn.cursor()
+
+        # Check if migration already applied
+        cursor.execute("PRAGMA table_info(user_interactions)")
+        column_types = {row[1]: row[2].upper() for row in cursor.fetchall()}
+
+        if column_types.get("action") != "VARCHAR":
+            # A leftover old table means an earlier run died mid-rebuild
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'table' AND name = 'user_interactions_old'"
+            )
+            if cursor.fetchone():
+                raise RuntimeError(
+                    "user_interactions_old still exists; restore it before re-running"
+                )
+            print("user_interactions.action is already an integer, skipping")
+            return True
+
+        table = UserInteraction.__table__
+        dialect = sqlite_dialect.dialect()
+
+        # Rename, rebuild and copy in one transaction: a failure at any step
+        # leaves the original table untouched
+        cursor.execute("BEGIN")
+        try:
+            cursor.execute(
+                "ALTER TABLE user_interactions RENAME TO user_interactions_old"
+            )
+
+            # Indexes follow the renamed table; drop them so the names can be reused
+            cursor.execute("PRAGMA index_list(user_interactions_old)")
+            for index_name in [row[1] for row in cursor.fetchall()]:
+                if not index_name.startswith("sqlite_autoindex"):
+                    cursor.execute(f"DROP INDEX {index_name}")
+
+            cursor.execute(str(CreateTable(table).compile(dialect=dialect)))
+            for index in table.indexes:
+                cursor.execute(str(CreateIndex(index).compile(dialect=dialect)))
+
+            cursor.execute(
+                """
+                INSERT INTO user_interactions
+                    (interaction_id, user_id, article_id, action, interacted_at)
+                SELECT
+                    interaction_id,
+                    user_id,
+                    article_id,
+                    CASE action
+                        WHEN 'viewed' THEN 1
+                        WHEN 'liked' THEN 2
+                        WHEN 'bookmarked' THEN 3
+                    END,
+                    interacted_at
+                FROM user_interactions_old
+                """
+            )
+            cursor.execute("DROP TABLE user_interactions_old")
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+        print("✓ Migration completed successfully")
+        return True
+
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        return False
+
+    finally:
+        if dbapi_conn is not None:
+            dbapi_conn.isolation_level = isolation_level
+        if conn is not None:
+            conn.close()
+
+
+if __name__ == "__main__":
+    # Run migration on the application database
+    run_migration()
@@ -3,7 +3,9 @@ from __future__ import annotations
 from collections.abc import Generator
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import Insert, create_engine, event, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 # Use the unified SQLite file by default; can be overridden via environment variables
@@ -13,9 +15,35 @@ DB_URL = os.getenv(
 
 engine = create_engine(
     DB_URL,
-    connect_args={"check_same_thread": False} if DB_URL.startswith("sqlite") else {},
+    # cached_statements: sqlite3's per-connection prepared statement cache
+    # (default 128), sized so the app's fixed set of queries never gets evicted
+    connect_args=(
+        {"check_same_thread": False, "cached_statements": 256}
+        if DB_URL.startswith("sqlite")
+        else {}
+    ),
     echo=False,  # Set to True for SQL query logging during development
 )
+
+# Applied once to every new SQLite connection. WAL lets API reads run alongside
+# worker writes, and synchronous=NORMAL is durable under WAL without the second
+# fsync per commit. cache_size is in KiB when negative (64 MB per connection).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, connection_record):
+        for pragma in SQLITE_PRAGMAS:
+            dbapi_conn.execute(pragma)
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -23,6 +51,27 @@ class Base(DeclarativeBase):
     pass
 
 
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def insert_ignoring_conflicts(table, index_elements: list[str]) -> Insert:
+    """
+    Build an INSERT that skips rows conflicting on a unique index.
+
+    Args:
+        table: Mapped class or Table to insert into
+        index_elements: Columns of the unique index to check for conflicts
+
+    Returns:
+        INSERT ... ON CONFLICT DO NOTHING, or a plain INSERT on other dialects
+    """
+    dialect_insert = _CONFLICT_INSERTS.get(engine.dialect.name)
+    if dialect_insert is None:
+        return insert(table)
+    return dialect_insert(table).on_conflict_do_nothing(index_elements=index_elements)
+
+
 def get_session() -> Generator[Session, None, None]:
     """
     Dependency function to get a database session for FastAPI endpoints.
@@ -36,13 +85,3 @@ def get_session() -> Generator[Session, None, None]:
     finally:
         db.close()
 
-
-def init_database() -> None:
-    """
-    Initialize the database by creating all tables defined in SQLAlchemy models.
-    This should be called on application startup.
-    """
-    # Import all models to ensure they're registered with Base.metadata
-
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
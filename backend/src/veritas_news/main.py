@@ -45,12 +45,17 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting Veritas News API...")
 
-    # Initialize database
-    success = init_db()
-    if success:
-        logger.info("✅ Database initialized successfully")
+    # Initialize database (disable when tables are created out-of-band with
+    # `python -m veritas_news.db.init_db`, e.g. before starting several workers)
+    db_init_on_startup = os.getenv("DB_INIT_ON_STARTUP", "true").lower() == "true"
+    if db_init_on_startup:
+        success = init_db()
+        if success:
+            logger.info("✅ Database initialized successfully")
+        else:
+            logger.error("❌ Database initialization failed")
     else:
-        logger.error("❌ Database initialization failed")
+        logger.info("⏭️  Skipping database initialization (DB_INIT_ON_STARTUP=false)")
 
     # Start background worker if enabled
     worker_enabled = os.getenv("WORKER_ENABLED", "true").lower() == "true"
@@ -130,6 +135,7 @@ async def lifespan(app: FastAPI):
                 await worker_task
             except asyncio.CancelledError:
                 pass
+        await news_worker.aclose()
         logger.info("✅ Background worker stopped")
     logger.info("👋 Application shutdown complete")
 
@@ -1,21 +1,58 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
+from enum import IntEnum
 
 from sqlalchemy import (
     CheckConstraint,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
+    TypeDecorator,
+    func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from ..db.sqlalchemy import Base
 
 
+class InteractionAction(IntEnum):
+    """Kinds of user interaction with an article, stored as a small integer."""
+
+    VIEWED = 1
+    LIKED = 2
+    BOOKMARKED = 3
+
+
+class InteractionActionType(TypeDecorator):
+    """Map InteractionAction to a SMALLINT column.
+
+    Binds accept enum members or their names ("viewed", "liked", "bookmarked")
+    so callers can keep passing the old string values.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return int(InteractionAction[value.upper()])
+            except KeyError:
+                raise ValueError(f"Unknown interaction action: {value!r}") from None
+        return int(InteractionAction(value))
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else InteractionAction(value)
+
+
 class User(Base):
     """User model representing application users."""
 
@@ -29,7 +66,7 @@ class User(Base):
     )
     email: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -42,17 +79,25 @@ class Article(Base):
     """Article model representing news articles."""
 
     __tablename__ = "articles"
+    __table_args__ = (
+        # Newest-first listings (ORDER BY created_at DESC LIMIT n) and the
+        # per-source count/latest summary (GROUP BY source, MAX(created_at))
+        Index("ix_articles_created_at", "created_at"),
+        Index("ix_articles_source_created", "source", "created_at"),
+    )
 
     article_id: Mapped[int] = mapped_column(
         "article_id", Integer, primary_key=True, index=True, autoincrement=True
     )
-    title: Mapped[str] = mapped_column(String, nullable=False)
+    title: Mapped[str] = mapped_column(String, nullable=False, index=True)
     source: Mapped[str | None] = mapped_column(String, nullable=True)
     url: Mapped[str | None] = mapped_column(String, unique=True, nullable=True)
-    published_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    published_at: Mapped[datetime | None] = mapped_column(
+        DateTime, nullable=True, index=True
+    )
     raw_text: Mapped[str | None] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -80,7 +125,7 @@ class Summary(Base):
     )
     summary_text: Mapped[str] = mapped_column(Text, nullable=False)
     generated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -92,6 +137,11 @@ class BiasRating(Base):
 
     __tablename__ = "bias_ratings"
 
+    # Latest rating for an article: index range scan instead of scan + sort
+    __table_args__ = (
+        Index("ix_bias_ratings_article_evaluated", "article_id", "evaluated_at"),
+    )
+
     rating_id: Mapped[int] = mapped_column(
         "rating_id", Integer, primary_key=True, index=True, autoincrement=True
     )
@@ -108,7 +158,7 @@ class BiasRating(Base):
 
     reasoning: Mapped[str | None] = mapped_column(Text, nullable=True)
     evaluated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
     )
 
     # SECM Binary Variables - Ideological Dimension (Left Markers)
@@ -158,9 +208,10 @@ class UserInteraction(Base):
     __tablename__ = "user_interactions"
 
     __table_args__ = (
-        CheckConstraint(
-            "action IN ('viewed', 'liked', 'bookmarked')", name="check_action"
-        ),
+        CheckConstraint("action BETWEEN 1 AND 3", name="check_action"),
+        # Recent interactions by user / on an article
+        Index("ix_user_interactions_user_interacted", "user_id", "interacted_at"),
+        Index("ix_user_interactions_article_interacted", "article_id", "interacted_at"),
     )
 
     interaction_id: Mapped[int] = mapped_column(
@@ -170,9 +221,11 @@ class UserInteraction(Base):
     article_id: Mapped[int] = mapped_column(
         ForeignKey("articles.article_id"), nullable=False
     )
-    action: Mapped[str] = mapped_column(String, nullable=False)
+    action: Mapped[InteractionAction] = mapped_column(
+        InteractionActionType, nullable=False
+    )
     interacted_at: Mapped[datetime] = mapped_column(
-        DateTime, default=lambda: datetime.now(UTC), nullable=False
+        DateTime, default=func.now(), server_default=func.now(), nullable=False
     )
 
     # Relationships
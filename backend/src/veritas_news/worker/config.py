@@ -1,3 +1,4 @@
+import functools
 import os
 from typing import Any
 
@@ -5,18 +6,9 @@ from typing import Any
 class WorkerConfig:
     """Configuration for the news worker"""
 
-    # Polling intervals in seconds
+    # Polling intervals in seconds; per-source overrides (NEWSAPI_POLL_INTERVAL,
+    # REUTERS_POLL_INTERVAL, RSS_POLL_INTERVAL) are read in get_source_config
     DEFAULT_POLL_INTERVAL = 30 * 60  # 30 minutes
-    NEWSAPI_POLL_INTERVAL = int(
-        os.getenv("NEWSAPI_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)
-    )
-    REUTERS_POLL_INTERVAL = int(
-        os.getenv("REUTERS_POLL_INTERVAL", DEFAULT_POLL_INTERVAL)
-    )
-    RSS_POLL_INTERVAL = int(os.getenv("RSS_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
-
-    # API Keys
-    NEWSAPI_KEY = os.getenv("NEWSAPI_KEY", "stub_key")
 
     # RSS Sources - these are the default RSS feeds that work reliably
     RSS_FEEDS = [
@@ -31,13 +23,27 @@ class WorkerConfig:
     MAX_RETRIES = 3
 
     @classmethod
+    def _poll_interval(cls, env_var: str) -> int:
+        """Read a polling interval override from the environment"""
+        return int(os.getenv(env_var, cls.DEFAULT_POLL_INTERVAL))
+
+    @classmethod
+    @functools.cache
     def get_source_config(cls) -> dict[str, Any]:
-        """Get configuration for all news sources"""
+        """
+        Get configuration for all news sources.
+
+        The environment is read on first use rather than at import time and
+        the result is cached, since it is fixed for the life of the process.
+        """
         return {
             "newsapi": {
-                "interval": cls.NEWSAPI_POLL_INTERVAL,
-                "api_key": cls.NEWSAPI_KEY,
+                "interval": cls._poll_interval("NEWSAPI_POLL_INTERVAL"),
+                "api_key": os.getenv("NEWSAPI_KEY", "stub_key"),
+            },
+            "reuters": {"interval": cls._poll_interval("REUTERS_POLL_INTERVAL")},
+            "rss": {
+                "interval": cls._poll_interval("RSS_POLL_INTERVAL"),
+                "feeds": cls.RSS_FEEDS,
             },
-            "reuters": {"interval": cls.REUTERS_POLL_INTERVAL},
-            "rss": {"interval": cls.RSS_POLL_INTERVAL, "feeds": cls.RSS_FEEDS},
         }
@@ -1,57 +1,151 @@
 import asyncio
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+import itertools
 from typing import Any
+from urllib.parse import urlsplit
+import xml.etree.ElementTree as ET
 
 import feedparser
+from feedparser.sanitizer import _sanitize_html as _feedparser_sanitize
 import httpx
 from loguru import logger
 
 from .config import WorkerConfig
 
 
+@dataclass(slots=True)
 class ArticleData:
     """Data structure for raw article information"""
 
-    def __init__(
-        self,
-        title: str,
-        source: str,
-        url: str,
-        published_at: datetime | None = None,
-        raw_text: str = "",
-    ):
-        self.title = title
-        self.source = source
-        self.url = url
-        self.published_at = published_at or datetime.now(UTC)
-        self.raw_text = raw_text
+    title: str
+    source: str
+    url: str
+    published_at: datetime | None = None
+    raw_text: str = ""
+
+    def __post_init__(self):
+        if self.published_at is None:
+            self.published_at = datetime.now(UTC)
+
+
+# Element names for the RSS 2.0 / Atom fast path in RSSFetcher
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+
+def element_text(element: ET.Element | None) -> str:
+    """Stripped text of an element, or "" if it is missing or empty"""
+    if element is None or element.text is None:
+        return ""
+    return element.text.strip()
+
+
+def sanitize_html(markup: str) -> str:
+    """
+    Sanitize feed HTML the same way feedparser does for its entries.
+
+    Drops <script>, event handler attributes and other unsafe markup, so the
+    fast path stores the same raw_text as the feedparser fallback.
+    """
+    if not markup:
+        return ""
+    return _feedparser_sanitize(markup, "utf-8", "text/html")
+
+
+def _atom_text(element: ET.Element | None) -> str:
+    """Text of an Atom text construct; HTML types are sanitized, plain text is not"""
+    text = element_text(element)
+    if text and element.get("type", "text") != "text":
+        return sanitize_html(text)
+    return text
+
+
+def parse_feed_date(value: str, iso: bool) -> datetime | None:
+    """Parse an RSS (RFC 822) or Atom (ISO 8601) date into an aware UTC datetime"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value) if iso else parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+# Browser-like headers so feeds don't block the worker
+RSS_REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/rss+xml, application/xml, text/xml, */*",
+}
+
+
+# One verified TLS context for every client: building a context loads the CA
+# bundle, and sharing it lets TLS sessions be resumed across clients
+_SSL_CONTEXT = httpx.create_ssl_context()
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by the fetchers"""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        verify=_SSL_CONTEXT,
+        follow_redirects=True,
+        headers=RSS_REQUEST_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=32),
+    )
 
 
 class RSSFetcher:
     """RSS feed parser that fetches real articles from RSS feeds"""
 
-    def __init__(self, feeds: list[str], limit_per_feed: int = 5):
+    def __init__(
+        self,
+        feeds: list[str],
+        limit_per_feed: int = 5,
+        client: httpx.AsyncClient | None = None,
+    ):
         self.feeds = feeds
         self.limit_per_feed = limit_per_feed
+        self.client = client
+        # Feed URLs don't change between polls, so derive the fallback
+        # source names once instead of re-parsing the URL on every fetch
+        self._url_source_names = {
+            feed_url: self._source_name_from_url(feed_url) for feed_url in feeds
+        }
 
     async def fetch_articles(self) -> list[ArticleData]:
-        """Fetch articles from RSS feeds"""
+        """Fetch articles from all RSS feeds concurrently"""
         logger.info(f"Fetching articles from {len(self.feeds)} RSS feeds")
 
-        all_articles = []
+        if self.client is not None:
+            results = await self._fetch_feeds(self.client)
+        else:
+            # No shared client injected: use one client for this whole batch
+            async with create_http_client() as client:
+                results = await self._fetch_feeds(client)
 
-        for feed_url in self.feeds:
-            try:
-                articles = await self._fetch_single_feed(feed_url)
-                all_articles.extend(articles)
-            except Exception as e:
-                logger.error(f"Error fetching RSS feed {feed_url}: {e}")
-                continue
+        all_articles = list(itertools.chain.from_iterable(results))
 
         logger.info(f"RSS feeds returned {len(all_articles)} total articles")
         return all_articles
 
-    async def _fetch_single_feed(self, feed_url: str) -> list[ArticleData]:
+    async def _fetch_feeds(self, client: httpx.AsyncClient) -> list[list[ArticleData]]:
+        """Fetch every feed over the given client, one task per feed"""
+        # _fetch_single_feed handles its own errors, so one bad feed returns []
+        # instead of cancelling the rest of the group
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(self._fetch_single_feed(client, feed_url))
+                for feed_url in self.feeds
+            ]
+        return [task.result() for task in tasks]
+
+    async def _fetch_single_feed(
+        self, client: httpx.AsyncClient, feed_url: str
+    ) -> list[ArticleData]:
         """Fetch articles from a single RSS feed"""
         logger.info(f"Processing RSS feed: {feed_url}")
 
@@ -59,38 +153,14 @@ class RSSFetcher:
         await asyncio.sleep(0.5)
 
         try:
-            # Fetch RSS feed with custom headers to avoid blocking
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml, */*",
-            }
-
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(feed_url, headers=headers)
-                response.raise_for_status()
-
-            # Parse RSS feed
-            feed = feedparser.parse(response.text)
-
-            if not feed.entries:
-                logger.warning(f"No entries found in RSS feed: {feed_url}")
-                return []
-
-            # Extract source name from feed URL
-            source_name = self._extract_source_name(feed_url, feed)
-
-            articles = []
-            for entry in feed.entries[: self.limit_per_feed]:
-                try:
-                    article = self._parse_entry(entry, source_name)
-                    if article:
-                        articles.append(article)
-                except Exception as e:
-                    logger.error(f"Error parsing RSS entry: {e}")
-                    continue
+            response = await client.get(feed_url)
+            response.raise_for_status()
+
+            # feedparser is blocking, so parse off the event loop; parses for
+            # different feeds then overlap instead of running back to back
+            articles = await asyncio.to_thread(
+                self._parse_feed, feed_url, response.text
+            )
 
             logger.info(f"Fetched {len(articles)} articles from {feed_url}")
             return articles
@@ -102,18 +172,151 @@ class RSSFetcher:
             logger.error(f"Error processing RSS feed {feed_url}: {e}")
             return []
 
+    def _parse_feed(self, feed_url: str, feed_text: str) -> list[ArticleData]:
+        """Parse a fetched RSS document into ArticleData (runs in a worker thread)"""
+        # Well-formed RSS 2.0 / Atom goes through the C XML parser; anything
+        # else (RDF, malformed XML) falls back to feedparser's lenient parser
+        articles = self._parse_feed_etree(feed_url, feed_text)
+        if articles is not None:
+            return articles
+
+        feed = feedparser.parse(feed_text)
+
+        if not feed.entries:
+            logger.warning(f"No entries found in RSS feed: {feed_url}")
+            return []
+
+        # Extract source name from feed URL
+        source_name = self._extract_source_name(feed_url, feed)
+
+        articles = []
+        for entry in feed.entries[: self.limit_per_feed]:
+            try:
+                article = self._parse_entry(entry, source_name)
+                if article:
+                    articles.append(article)
+            except Exception as e:
+                logger.error(f"Error parsing RSS entry: {e}")
+                continue
+
+        return articles
+
+    def _parse_feed_etree(
+        self, feed_url: str, feed_text: str
+    ) -> list[ArticleData] | None:
+        """
+        Parse RSS 2.0 or Atom with xml.etree, stopping at limit_per_feed entries.
+
+        Returns:
+            List of articles, or None if the document needs feedparser instead
+        """
+        try:
+            root = ET.fromstring(feed_text.lstrip())
+        except ET.ParseError:
+            return None
+
+        if root.tag == "rss":
+            channel = root.find("channel")
+            if channel is None:
+                return None
+            feed_title = element_text(channel.find("title"))
+            entries = channel.iter("item")
+            parse_entry = self._parse_rss_item
+        elif root.tag == f"{_ATOM}feed":
+            feed_title = element_text(root.find(f"{_ATOM}title"))
+            entries = root.iter(f"{_ATOM}entry")
+            parse_entry = self._parse_atom_entry
+        else:
+            return None
+
+        source_name = (
+            feed_title
+            or self._url_source_names.get(feed_url)
+            or self._source_name_from_url(feed_url)
+        )
+
+        articles = []
+        for entry in entries:
+            if len(articles) >= self.limit_per_feed:
+                break
+            article = parse_entry(entry, source_name)
+            if article:
+                articles.append(article)
+
+        if not articles:
+            logger.warning(f"No entries found in RSS feed: {feed_url}")
+        return articles
+
+    def _parse_rss_item(self, item: ET.Element, source_name: str) -> ArticleData | None:
+        """Parse an RSS 2.0 <item> into ArticleData"""
+        url = element_text(item.find("link"))
+        if not url:
+            guid = element_text(item.find("guid"))
+            url = guid if guid.startswith("http") else ""
+        if not url:
+            logger.debug("Skipping RSS item without URL")
+            return None
+
+        raw_text = sanitize_html(
+            element_text(item.find("description"))
+            or element_text(item.find(_RSS_CONTENT_ENCODED))
+        )
+
+        return ArticleData(
+            title=element_text(item.find("title")) or "No Title",
+            source=source_name,
+            url=url,
+            published_at=parse_feed_date(element_text(item.find("pubDate")), iso=False),
+            raw_text=raw_text or "No content available",
+        )
+
+    def _parse_atom_entry(
+        self, entry: ET.Element, source_name: str
+    ) -> ArticleData | None:
+        """Parse an Atom <entry> into ArticleData"""
+        url = ""
+        for link in entry.iter(f"{_ATOM}link"):
+            if link.get("rel", "alternate") == "alternate" and link.get("href"):
+                url = link.get("href").strip()
+                break
+        if not url:
+            entry_id = element_text(entry.find(f"{_ATOM}id"))
+            url = entry_id if entry_id.startswith("http") else ""
+        if not url:
+            logger.debug("Skipping Atom entry without URL")
+            return None
+
+        raw_text = _atom_text(entry.find(f"{_ATOM}summary")) or _atom_text(
+            entry.find(f"{_ATOM}content")
+        )
+        published_at = parse_feed_date(
+            element_text(entry.find(f"{_ATOM}published")), iso=True
+        ) or parse_feed_date(element_text(entry.find(f"{_ATOM}updated")), iso=True)
+
+        return ArticleData(
+            title=element_text(entry.find(f"{_ATOM}title")) or "No Title",
+            source=source_name,
+            url=url,
+            published_at=published_at,
+            raw_text=raw_text or "No content available",
+        )
+
     def _extract_source_name(self, feed_url: str, feed: Any) -> str:
         """Extract a readable source name from feed metadata or URL"""
         # Try to get title from feed metadata
         if hasattr(feed, "feed") and hasattr(feed.feed, "title") and feed.feed.title:
             return feed.feed.title
 
-        # Extract domain name as fallback
-        try:
-            from urllib.parse import urlparse
+        # Fall back to the domain name precomputed for this feed
+        if feed_url in self._url_source_names:
+            return self._url_source_names[feed_url]
+        return self._source_name_from_url(feed_url)
 
-            parsed = urlparse(feed_url)
-            domain = parsed.netloc
+    @staticmethod
+    def _source_name_from_url(feed_url: str) -> str:
+        """Derive a readable source name from the feed URL's domain"""
+        try:
+            domain = urlsplit(feed_url).netloc
             # Remove www. prefix and common suffixes
             domain = domain.replace("www.", "").replace("feeds.", "").replace("rss.", "")
             # Get the main part of the domain
@@ -199,7 +402,13 @@ class NewsFetcher:
 
     def __init__(self):
         config = WorkerConfig.get_source_config()
-        self.rss_fetcher = RSSFetcher(config["rss"]["feeds"])
+        # One pooled client so connections are reused across feeds and polls
+        self._client = create_http_client()
+        self.rss_fetcher = RSSFetcher(config["rss"]["feeds"], client=self._client)
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        await self._client.aclose()
 
     async def fetch_all_sources(self) -> list[ArticleData]:
         """Fetch articles from RSS feeds"""
@@ -15,26 +15,29 @@ import argparse
 import asyncio
 import signal
 import sys
+from typing import ClassVar
 
 from loguru import logger
 
-from ..db.init_db import get_connection, init_db
+from ..db.init_db import init_db
 from .scheduler import JobScheduler
 
 
 class NewsWorker:
     """Main news worker application"""
 
+    # Set once the schema has been created in this process
+    _db_ready: ClassVar[bool] = False
+
     def __init__(self):
         self.scheduler = JobScheduler()
-        self.shutdown_event = asyncio.Event()
 
-    def setup_signal_handlers(self):
-        """Setup signal handlers for graceful shutdown"""
+    def setup_signal_handlers(self, scheduler_task: asyncio.Task):
+        """Setup signal handlers that cancel the scheduler task for graceful shutdown"""
 
         def signal_handler():
             logger.info("Received shutdown signal")
-            self.shutdown_event.set()
+            scheduler_task.cancel()
 
         if sys.platform != "win32":
             loop = asyncio.get_running_loop()
@@ -48,31 +51,29 @@ class NewsWorker:
         # Initialize database
         self.ensure_database()
 
-        # Setup signal handlers
-        self.setup_signal_handlers()
-
         try:
-            # Start scheduler
+            # Start scheduler; a shutdown signal cancels it directly
             scheduler_task = asyncio.create_task(self.scheduler.start())
-
-            # Wait for shutdown signal or scheduler completion
-            done, pending = await asyncio.wait(
-                [scheduler_task, asyncio.create_task(self.shutdown_event.wait())],
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-
-            # Cancel remaining tasks
-            for task in pending:
-                task.cancel()
-
-            # Stop scheduler gracefully
-            await self.scheduler.stop()
+            self.setup_signal_handlers(scheduler_task)
+
+            try:
+                await scheduler_task
+            except asyncio.CancelledError:
+                # Only absorb the signal handler's cancel of scheduler_task;
+                # a cancel of run_scheduler itself must keep propagating
+                if asyncio.current_task().cancelling():
+                    raise
+                logger.info("Scheduler cancelled")
+            finally:
+                # Stop scheduler gracefully
+                await self.scheduler.stop()
 
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt")
         except Exception as e:
             logger.error(f"Error running scheduler: {e}")
         finally:
+            await self.scheduler.fetcher.aclose()
             logger.info("News worker shutdown complete")
 
     async def run_single_fetch(self):
@@ -98,6 +99,8 @@ class NewsWorker:
         except Exception as e:
             logger.error(f"Error in single fetch: {e}")
             return []
+        finally:
+            await self.scheduler.fetcher.aclose()
 
     def get_status(self):
         """Get and display current status"""
@@ -123,15 +126,13 @@ class NewsWorker:
         return status
 
     def ensure_database(self):
-        """Ensure database is initialized"""
-        try:
-            conn = get_connection()
-            init_db(conn)
-            conn.close()
-            logger.info("Database initialized successfully")
-        except Exception as e:
-            logger.error(f"Database initialization failed: {e}")
-            raise
+        """Ensure database is initialized (once per process)"""
+        if NewsWorker._db_ready:
+            return
+        if not init_db():
+            raise RuntimeError("Database initialization failed")
+        NewsWorker._db_ready = True
+        logger.info("Database initialized successfully")
 
 
 async def main():
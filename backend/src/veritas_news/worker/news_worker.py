@@ -2,32 +2,45 @@
 """
 Simplified News Worker
 
-Fetches articles from stubbed sources and stores them in the database.
+Fetches articles from RSS feeds, CNN or NewsAPI and stores them in the database.
 """
 
 import argparse
 import asyncio
 from datetime import UTC, datetime, timedelta
+import itertools
 import os
 from pathlib import Path
 import sys
+import time
+import xml.etree.ElementTree as ET
 
 from dotenv import load_dotenv
 import feedparser
 import httpx
 from loguru import logger
 from newsapi import NewsApiClient
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from ..ai import rate_bias, rate_secm, summarize_with_gemini
 from ..db.init_db import get_connection, init_db
+from ..db.sqlalchemy import insert_ignoring_conflicts
 from ..models.bias_rating import normalize_score_to_range
 from ..models.sqlalchemy_models import Article, BiasRating, Summary
+from .fetchers import (
+    create_http_client,
+    element_text,
+    parse_feed_date,
+    sanitize_html,
+)
 
 # Configuration
 POLL_INTERVAL = 30 * 60  # 30 minutes in seconds
 DEFAULT_HOURS_BACK = 1  # Default to last 1 hour
 DEFAULT_ARTICLE_LIMIT = 5  # Default limit of 5 articles per feed
+SOURCE_REQUEST_INTERVAL = 1.0  # Minimum seconds between requests to one source
+FEED_PARSE_CHUNK_SIZE = 16 * 1024  # Characters fed to the RSS parser at a time
 
 
 class NewsWorker:
@@ -40,6 +53,35 @@ class NewsWorker:
         self.running = False
         self.hours_back = hours_back
         self.limit = limit
+        # Pooled HTTP client reused across fetch cycles (created on first use)
+        self._http_client: httpx.AsyncClient | None = None
+        # time.monotonic() of the last request per source, for rate limiting
+        self._last_request_at: dict[str, float] = {}
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._http_client is None:
+            self._http_client = create_http_client()
+        return self._http_client
+
+    async def _throttle(self, source: str):
+        """Wait until SOURCE_REQUEST_INTERVAL has passed since the last request to source
+
+        Only sleeps for the remainder of the interval, so fetches that are
+        already far enough apart are not delayed.
+        """
+        last = self._last_request_at.get(source)
+        if last is not None:
+            wait = SOURCE_REQUEST_INTERVAL - (time.monotonic() - last)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        self._last_request_at[source] = time.monotonic()
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
 
     async def fetch_rss_articles(self) -> list[dict]:
         """Fetch articles from configured RSS feeds"""
@@ -49,7 +91,11 @@ class NewsWorker:
         logger.info(f"Fetching articles from RSS feeds, limit {self.limit}")
 
         try:
-            fetcher = RSSFetcher(WorkerConfig.RSS_FEEDS, limit_per_feed=self.limit)
+            fetcher = RSSFetcher(
+                WorkerConfig.RSS_FEEDS,
+                limit_per_feed=self.limit,
+                client=self._get_http_client(),
+            )
             article_data_list = await fetcher.fetch_articles()
 
             # Convert ArticleData objects to dict format
@@ -81,93 +127,170 @@ class NewsWorker:
             rss_url = "http://rss.cnn.com/rss/cnn_topstories.rss"
 
             # Rate limiting - be respectful
-            await asyncio.sleep(1.0)
+            await self._throttle("cnn")
 
-            # Fetch RSS feed with custom headers to avoid blocking
+            # Fetch RSS feed over the shared client (browser-like headers are
+            # set on the client to avoid blocking)
             logger.debug(f"Fetching RSS from: {rss_url}")
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/rss+xml, application/xml, text/xml",
-            }
-
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                verify=False,  # Skip SSL verification for testing
-                follow_redirects=True,
-            ) as client:
-                response = await client.get(rss_url, headers=headers)
-                logger.debug(f"HTTP response status: {response.status_code}")
-                logger.debug(f"Response headers: {dict(response.headers)}")
-                response.raise_for_status()
+            response = await self._get_http_client().get(rss_url)
+            logger.debug(f"HTTP response status: {response.status_code}")
+            # Lazy: the headers dict is only built when DEBUG is enabled
+            logger.opt(lazy=True).debug(
+                "Response headers: {}", lambda: dict(response.headers)
+            )
+            response.raise_for_status()
 
             # Parse RSS feed
-            logger.debug(f"Response content length: {len(response.text)}")
-            logger.debug(f"Response content preview: {response.text[:200]}...")
-            feed = feedparser.parse(response.text)
-            logger.debug(f"Feedparser found {len(feed.entries)} entries")
-
-            if not feed.entries:
-                logger.warning("No entries found in CNN RSS feed")
-                return []
+            logger.opt(lazy=True).debug(
+                "Response content length: {}", lambda: len(response.text)
+            )
+            logger.opt(lazy=True).debug(
+                "Response content preview: {}...", lambda: response.text[:200]
+            )
 
             # Calculate cutoff time
             cutoff_time = datetime.now(UTC) - timedelta(hours=self.hours_back)
 
-            articles = []
-            for entry in feed.entries:
-                # Stop if we've reached the limit
-                if len(articles) >= self.limit:
-                    break
+            # Parsing is CPU-bound; run it in a thread so other fetches proceed
+            articles = await asyncio.to_thread(
+                self._parse_cnn_feed, response.text, cutoff_time
+            )
+            logger.info(f"Fetched {len(articles)} recent CNN articles")
+            return articles
 
-                try:
-                    # Parse publication date
-                    published_at = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        published_at = datetime(
-                            *entry.published_parsed[:6], tzinfo=UTC
-                        )
+        except Exception as e:
+            logger.error(f"Error fetching CNN RSS feed: {e}")
+            return []
 
-                    # Skip articles older than cutoff
-                    if published_at and published_at < cutoff_time:
-                        logger.debug(
-                            f"Skipping old article: {entry.title} ({published_at})"
-                        )
-                        continue
+    def _parse_cnn_feed(self, feed_text: str, cutoff_time: datetime) -> list[dict]:
+        """Parse up to self.limit articles newer than cutoff_time from the CNN feed"""
+        articles = self._stream_cnn_items(feed_text, cutoff_time)
+        if articles is not None:
+            return articles
 
-                    # Extract article data
-                    article = {
-                        "title": (
-                            entry.title.strip()
-                            if hasattr(entry, "title")
-                            else "No Title"
-                        ),
-                        "source": "CNN",
-                        "url": entry.link.strip() if hasattr(entry, "link") else "",
-                        "raw_text": (
-                            entry.summary.strip()
-                            if hasattr(entry, "summary")
-                            else "No content available"
-                        ),
-                        "published_at": published_at or datetime.now(UTC),
-                    }
+        # Not plain RSS 2.0 or not well-formed XML (e.g. an undefined entity
+        # such as &nbsp;): let feedparser's lenient parser deal with it
+        feed = feedparser.parse(feed_text)
+        logger.debug(f"Feedparser found {len(feed.entries)} entries")
 
-                    # Skip if no URL
-                    if not article["url"]:
-                        continue
+        if not feed.entries:
+            logger.warning("No entries found in CNN RSS feed")
+            return []
 
-                    articles.append(article)
-                    logger.debug(f"Added article: {article['title']}")
+        articles = []
+        for entry in feed.entries:
+            # Stop if we've reached the limit
+            if len(articles) >= self.limit:
+                break
 
-                except Exception as e:
-                    logger.error(f"Error parsing RSS entry: {e}")
+            try:
+                # Parse publication date
+                published_at = None
+                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                    published_at = datetime(*entry.published_parsed[:6], tzinfo=UTC)
+
+                # Skip articles older than cutoff
+                if published_at and published_at < cutoff_time:
+                    logger.debug(f"Skipping old article: {entry.title} ({published_at})")
                     continue
 
-            logger.info(f"Fetched {len(articles)} recent CNN articles")
-            return articles
+                # Extract article data
+                article = {
+                    "title": (
+                        entry.title.strip() if hasattr(entry, "title") else "No Title"
+                    ),
+                    "source": "CNN",
+                    "url": entry.link.strip() if hasattr(entry, "link") else "",
+                    "raw_text": (
+                        entry.summary.strip()
+                        if hasattr(entry, "summary")
+                        else "No content available"
+                    ),
+                    "published_at": published_at or datetime.now(UTC),
+                }
+
+                # Skip if no URL
+                if not article["url"]:
+                    continue
 
-        except Exception as e:
-            logger.error(f"Error fetching CNN RSS feed: {e}")
-            return []
+                articles.append(article)
+                logger.debug(f"Added article: {article['title']}")
+
+            except Exception as e:
+                logger.error(f"Error parsing RSS entry: {e}")
+                continue
+
+        return articles
+
+    def _stream_cnn_items(
+        self, feed_text: str, cutoff_time: datetime
+    ) -> list[dict] | None:
+        """
+        Stream <item> elements from an RSS 2.0 feed, stopping at self.limit.
+
+        The document is fed to the parser in chunks and each item is cleared once
+        read, so the rest of a long feed is never parsed.
+
+        Returns:
+            List of articles, or None if the feed is not RSS 2.0 or fails to parse
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        feed_text = feed_text.lstrip()
+        articles: list[dict] = []
+        seen_root = False
+
+        try:
+            for offset in range(0, len(feed_text), FEED_PARSE_CHUNK_SIZE):
+                parser.feed(feed_text[offset : offset + FEED_PARSE_CHUNK_SIZE])
+                for event, elem in parser.read_events():
+                    if not seen_root:
+                        if elem.tag != "rss":
+                            return None
+                        seen_root = True
+                    if event != "end" or elem.tag != "item":
+                        continue
+
+                    article = self._parse_cnn_item(elem, cutoff_time)
+                    elem.clear()
+                    if article:
+                        articles.append(article)
+                        if len(articles) >= self.limit:
+                            return articles
+            parser.close()
+        except ET.ParseError:
+            return None
+
+        if not seen_root:
+            return None
+        if not articles:
+            logger.warning("No entries found in CNN RSS feed")
+        return articles
+
+    @staticmethod
+    def _parse_cnn_item(item: ET.Element, cutoff_time: datetime) -> dict | None:
+        """Convert an RSS <item> to an article dict, or None if old or without URL"""
+        title = element_text(item.find("title")) or "No Title"
+        published_at = parse_feed_date(element_text(item.find("pubDate")), iso=False)
+
+        # Skip articles older than cutoff
+        if published_at and published_at < cutoff_time:
+            logger.debug(f"Skipping old article: {title} ({published_at})")
+            return None
+
+        # Skip if no URL
+        url = element_text(item.find("link"))
+        if not url:
+            return None
+
+        logger.debug(f"Added article: {title}")
+        return {
+            "title": title,
+            "source": "CNN",
+            "url": url,
+            "raw_text": sanitize_html(element_text(item.find("description")))
+            or "No content available",
+            "published_at": published_at or datetime.now(UTC),
+        }
 
     async def fetch_newsapi_headlines(self) -> list[dict]:
         """Fetch top headlines from NewsAPI for US in English"""
@@ -184,11 +307,14 @@ class NewsWorker:
             newsapi = NewsApiClient(api_key=api_key)
 
             # Rate limiting - be respectful to API
-            await asyncio.sleep(1.0)
+            await self._throttle("newsapi")
 
-            # Fetch top headlines for US in English
+            # Fetch top headlines for US in English. newsapi-python makes a
+            # blocking HTTP request and decodes the JSON body synchronously, so
+            # run it in a thread instead of stalling the event loop
             logger.debug(f"Fetching US headlines with limit {self.limit}")
-            response = newsapi.get_top_headlines(
+            response = await asyncio.to_thread(
+                newsapi.get_top_headlines,
                 country="us",
                 language="en",
                 page_size=min(self.limit, 100),  # API max is 100
@@ -294,6 +420,58 @@ class NewsWorker:
             db.rollback()
             return None
 
+    def store_articles(self, db: Session, articles: list[dict]) -> list[int | None]:
+        """Store a batch of articles in a single INSERT OR IGNORE transaction
+
+        Articles whose URL is already stored are skipped by the UNIQUE(url)
+        constraint instead of being looked up first. Falls back to
+        store_article() per row if the batch insert fails, so one bad article
+        does not drop the rest.
+
+        Returns:
+            article_id for each article in input order (None if skipped or failed)
+        """
+        if not articles:
+            return []
+
+        try:
+            now = datetime.now(UTC)
+            rows = [
+                {
+                    "title": article["title"],
+                    "source": article["source"],
+                    "url": article["url"],
+                    "published_at": article["published_at"] or now,
+                    "raw_text": article["raw_text"],
+                    "created_at": now,
+                }
+                for article in articles
+            ]
+
+            stmt = insert_ignoring_conflicts(Article, ["url"]).returning(
+                Article.article_id, Article.url
+            )
+            ids_by_url = {url: article_id for article_id, url in db.execute(stmt, rows)}
+            db.commit()
+
+        except Exception as e:
+            logger.warning(f"Batch insert failed, storing articles individually: {e}")
+            db.rollback()
+            return [self.store_article(db, article) for article in articles]
+
+        self.processed_urls.update(article["url"] for article in articles)
+
+        article_ids = []
+        for article in articles:
+            article_id = ids_by_url.get(article["url"])
+            if article_id is None:
+                logger.debug(f"Duplicate skipped: {article['title']}")
+            else:
+                logger.info(f"Stored: {article['title']} (ID: {article_id})")
+            article_ids.append(article_id)
+
+        return article_ids
+
     def generate_article_summary(self, db: Session, article_id: int, raw_text: str) -> bool:
         """Generate and store a summary for an article"""
         try:
@@ -468,25 +646,57 @@ class NewsWorker:
             bias_count = 0
 
             try:
-                for i, article in enumerate(articles, 1):
-                    if not self.is_duplicate(db, article):
-                        article_id = self.store_article(db, article)
-                        if article_id:
-                            stored_count += 1
-                            
-                            if run_llm:
-                                raw_text = article.get("raw_text", "")
-                                logger.info(f"📰 [{i}/{len(articles)}] Processing article {article_id}: {article['title'][:50]}...")
-                                
-                                # Generate summary
-                                if self.generate_article_summary(db, article_id, raw_text):
-                                    summary_count += 1
-                                
-                                # Analyze bias (legacy + SECM)
-                                if await self.analyze_article_bias(db, article_id, raw_text):
-                                    bias_count += 1
-                    else:
+                # Drop URLs already seen by this worker or repeated within the
+                # batch; the INSERT still ignores any URL stored concurrently
+                new_articles = []
+                batch_urls: set[str] = set()
+                for article in articles:
+                    url = article["url"]
+                    if url in batch_urls or url in self.processed_urls:
                         logger.debug(f"Duplicate skipped: {article['title']}")
+                        continue
+                    batch_urls.add(url)
+                    new_articles.append(article)
+
+                # One query for URLs already stored, instead of one per article
+                if batch_urls:
+                    existing_urls = set(
+                        db.scalars(select(Article.url).where(Article.url.in_(batch_urls)))
+                    )
+                    if existing_urls:
+                        self.processed_urls.update(existing_urls)
+                        unseen_articles = []
+                        for article in new_articles:
+                            if article["url"] in existing_urls:
+                                logger.debug(f"Duplicate skipped: {article['title']}")
+                            else:
+                                unseen_articles.append(article)
+                        new_articles = unseen_articles
+
+                # Run the blocking insert/commit in a thread so the event loop
+                # keeps serving other fetches while SQLite writes
+                article_ids = await asyncio.to_thread(self.store_articles, db, new_articles)
+                stored = [
+                    (article_id, article)
+                    for article_id, article in zip(article_ids, new_articles)
+                    if article_id
+                ]
+                stored_count = len(stored)
+
+                if run_llm:
+                    for i, (article_id, article) in enumerate(stored, 1):
+                        raw_text = article.get("raw_text", "")
+                        logger.info(f"📰 [{i}/{stored_count}] Processing article {article_id}: {article['title'][:50]}...")
+
+                        # Generate summary (blocking Gemini call + commit)
+                        if await asyncio.to_thread(
+                            self.generate_article_summary, db, article_id, raw_text
+                        ):
+                            summary_count += 1
+
+                        # Analyze bias (legacy + SECM)
+                        if await self.analyze_article_bias(db, article_id, raw_text):
+                            bias_count += 1
             except Exception as e:
                 logger.error(f"❌ Error processing articles: {e}")
 
@@ -530,7 +740,9 @@ class NewsWorker:
                     has_summary = db.query(Summary).filter(Summary.article_id == article.article_id).first()
                     
                     if not has_summary and article.raw_text:
-                        if self.generate_article_summary(db, article.article_id, article.raw_text):
+                        if await asyncio.to_thread(
+                            self.generate_article_summary, db, article.article_id, article.raw_text
+                        ):
                             summary_count += 1
                     
                     # Run bias analysis
@@ -594,7 +806,7 @@ class NewsWorker:
 
                 recent = (
                     db.query(Article.title, Article.source, Article.created_at)
-                    .order_by(Article.created_at.desc())
+                    .order_by(Article.created_at.desc(), Article.article_id.desc())
                     .limit(5)
                     .all()
                 )
@@ -622,18 +834,19 @@ class NewsWorker:
                         Article.url,
                         Article.created_at,
                     )
-                    .order_by(Article.created_at.desc())
+                    .order_by(Article.created_at.desc(), Article.article_id.desc())
                     .all()
                 )
 
-                print(f"\n=== ALL ARTICLES ({len(articles)} total) ===")
-                for article_id, title, source, url, created_at in articles:
-                    print(f"ID: {article_id}")
-                    print(f"Title: {title}")
-                    print(f"Source: {source}")
-                    print(f"URL: {url}")
-                    print(f"Created: {created_at}")
-                    print("-" * 50)
+                # Build the listing and write it once instead of six prints per row
+                separator = "-" * 50
+                lines = [f"\n=== ALL ARTICLES ({len(articles)} total) ==="]
+                lines.extend(
+                    f"ID: {article_id}\nTitle: {title}\nSource: {source}\n"
+                    f"URL: {url}\nCreated: {created_at}\n{separator}"
+                    for article_id, title, source, url, created_at in articles
+                )
+                sys.stdout.write("\n".join(lines) + "\n")
             except Exception as e:
                 logger.error(f"Error showing articles: {e}")
 
@@ -673,11 +886,15 @@ class NewsWorker:
                 db.rollback()
 
     def cleanup_memory(self, max_urls: int = 1000):
-        """Clean up processed_urls to prevent memory leak"""
+        """Clean up processed_urls to prevent memory leak
+
+        processed_urls is only a fast path: the UNIQUE(url) constraint still
+        rejects evicted URLs on insert, so dropping entries never stores a
+        duplicate.
+        """
         if len(self.processed_urls) > max_urls:
-            # Keep only the most recent half
-            urls_to_keep = list(self.processed_urls)[-max_urls // 2 :]
-            self.processed_urls = set(urls_to_keep)
+            # Keep half of the entries without copying the whole set to a list
+            self.processed_urls = set(itertools.islice(self.processed_urls, max_urls // 2))
             logger.info(f"Cleaned up processed URLs, kept {len(self.processed_urls)}")
 
 
@@ -690,7 +907,7 @@ async def main():
     parser = argparse.ArgumentParser(description="News Worker")
     parser.add_argument("--once", action="store_true", help="Run single fetch")
     parser.add_argument(
-        "--cnn", action="store_true", help="Use CNN scraper instead of stubs"
+        "--cnn", action="store_true", help="Use CNN scraper instead of RSS feeds"
     )
     parser.add_argument(
         "--newsapi", action="store_true", help="Use NewsAPI for headlines"
@@ -743,7 +960,15 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Stopped by user")
         worker.stop()
+    finally:
+        await worker.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; use its faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
@@ -1,17 +1,79 @@
+import asyncio
+from collections import OrderedDict
+from collections.abc import Iterable
 import sqlite3
+import threading
+import time
+from typing import Any
 
 from loguru import logger
+from sqlalchemy import Connection, Insert
+from sqlalchemy.exc import SQLAlchemyError
 
 from ..ai import summarize_with_gemini
-from ..db.init_db import get_connection
+from ..db.init_db import get_raw_connection
+from ..db.sqlalchemy import engine, insert_ignoring_conflicts
+from ..models.sqlalchemy_models import Article
 from .fetchers import ArticleData
 
+# How long read-only status queries are served from memory (seconds)
+READ_CACHE_TTL_SECONDS = 30
+
+# Recently stored URLs kept in memory to skip re-fetched articles without a query
+PROCESSED_URLS_MAX = 10_000
+
+# Rows per INSERT statement. Each execute is kept to a single statement so a
+# failure leaves none of its rows behind; a multi-statement executemany that
+# failed on a later page would keep the earlier pages' rows in the transaction
+INSERT_PAGE_ROWS = 500
+
+# Articles per duplicate title lookup query (one bound parameter each)
+DUPLICATE_LOOKUP_CHUNK = 900
+
+# Fixed SQL text so sqlite3's per-connection statement cache always hits
+_RECENT_ARTICLES_SQL = """
+SELECT article_id, title, source, url, published_at, created_at
+FROM articles
+ORDER BY created_at DESC, article_id DESC
+LIMIT ?
+"""
+_ARTICLE_COUNT_SQL = "SELECT COUNT(*) FROM articles"
+
 
 class ArticlePipeline:
     """Pipeline for processing and storing articles"""
 
     def __init__(self):
-        self._processed_urls: set[str] = set()
+        # Recently stored URLs, oldest first; bounded by PROCESSED_URLS_MAX
+        # since the database remains the authoritative duplicate check
+        self._processed_urls: OrderedDict[str, None] = OrderedDict()
+        # (query name, args) -> (expires_at, result); cleared whenever we store articles
+        self._read_cache: dict[tuple, tuple[float, Any]] = {}
+        # Built on first store and reused for every batch
+        self._insert_stmt: Insert | None = None
+        # Batches run in worker threads; one writer at a time avoids SQLite
+        # lock contention when fetch jobs overlap (WAL readers are unaffected)
+        self._write_lock = threading.Lock()
+
+    def _get_cached(self, key: tuple) -> Any | None:
+        """Return a cached read result if it has not expired"""
+        entry = self._read_cache.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def _set_cached(self, key: tuple, value: Any) -> None:
+        """Cache a read result for READ_CACHE_TTL_SECONDS"""
+        self._read_cache[key] = (time.monotonic() + READ_CACHE_TTL_SECONDS, value)
+
+    def _remember_urls(self, urls: Iterable[str]) -> None:
+        """Record stored URLs, evicting the oldest beyond PROCESSED_URLS_MAX"""
+        processed = self._processed_urls
+        for url in urls:
+            processed[url] = None
+            processed.move_to_end(url)
+        while len(processed) > PROCESSED_URLS_MAX:
+            processed.popitem(last=False)
 
     async def _get_article_summary(self, article_text: str) -> str | None:
         """
@@ -28,10 +90,13 @@ class ArticlePipeline:
             return None
 
         try:
-            # Call summarization function directly
-            summary = summarize_with_gemini(article_text)
+            # The Gemini client blocks; run it off the event loop so concurrent
+            # summaries overlap instead of stalling every other task
+            summary = await asyncio.to_thread(summarize_with_gemini, article_text)
             if summary:
-                logger.debug(f"Generated summary: {summary[:100]}...")
+                logger.opt(lazy=True).debug(
+                    "Generated summary: {}...", lambda: summary[:100]
+                )
                 return summary
             else:
                 logger.warning("Summarization returned empty summary")
@@ -42,158 +107,234 @@ class ArticlePipeline:
             logger.warning(f"Error getting summary: {e}, continuing without summary")
             return None
 
-    def _normalize_article(self, article: ArticleData) -> ArticleData:
-        """Basic article normalization"""
-        # Strip whitespace and normalize title
-        article.title = article.title.strip()
-        article.raw_text = article.raw_text.strip()
-        article.url = article.url.strip()
-
-        # Ensure we have required fields
-        if not article.title:
-            article.title = "Untitled Article"
-        if not article.raw_text:
-            article.raw_text = "No content available"
-
-        return article
-
-    def _is_duplicate(self, conn: sqlite3.Connection, article: ArticleData) -> bool:
-        """Check if article already exists in database"""
-        cursor = conn.cursor()
-
-        # Check by URL first (exact match)
-        cursor.execute("SELECT 1 FROM articles WHERE url = ?", (article.url,))
-        if cursor.fetchone():
-            return True
-
-        # Check by title similarity (basic exact match for now)
-        cursor.execute("SELECT 1 FROM articles WHERE title = ?", (article.title,))
-        if cursor.fetchone():
-            return True
-
-        # Check in-memory processed URLs
-        if article.url in self._processed_urls:
-            return True
-
-        return False
-
-    def _store_article(
-        self, conn: sqlite3.Connection, article: ArticleData
-    ) -> int | None:
-        """Store article in database and return article_id"""
-        try:
-            cursor = conn.cursor()
+    def _normalize_articles(
+        self, articles: list[ArticleData]
+    ) -> tuple[list[ArticleData], int]:
+        """
+        Basic normalization for a whole batch in one pass.
 
-            # Convert datetime to string for SQLite
-            published_at_str = (
-                article.published_at.isoformat() if article.published_at else None
-            )
+        Strips whitespace and fills in required fields in place. Articles that
+        cannot be normalized (e.g. a missing title) are dropped and counted.
 
-            query = """
-            INSERT INTO articles (title, source, url, published_at, raw_text, created_at)
-            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """
-
-            cursor.execute(
-                query,
-                (
-                    article.title,
-                    article.source,
-                    article.url,
-                    published_at_str,
-                    article.raw_text,
-                ),
-            )
+        Returns:
+            (normalized articles, number of articles dropped)
+        """
+        normalized = []
+        errors = 0
+        for article in articles:
+            try:
+                # Strip whitespace and ensure we have required fields
+                article.title = article.title.strip() or "Untitled Article"
+                article.raw_text = article.raw_text.strip() or "No content available"
+                article.url = article.url.strip()
+            except Exception as e:
+                logger.error(f"Error processing individual article: {e}")
+                errors += 1
+                continue
+            normalized.append(article)
+        return normalized, errors
+
+    def _find_existing_titles(
+        self, conn: sqlite3.Connection, articles: list[ArticleData]
+    ) -> set[str]:
+        """
+        Look up which of the batch's titles are already stored.
 
-            conn.commit()
-            article_id = cursor.lastrowid
+        Only titles need a lookup: URLs are UNIQUE, so stored URLs are skipped
+        by the INSERT itself (ON CONFLICT DO NOTHING). Issues one query per
+        chunk of DUPLICATE_LOOKUP_CHUNK articles, which keeps the bound
+        parameters well under SQLite's variable limit.
 
-            # Add to processed URLs set
-            self._processed_urls.add(article.url)
+        Returns:
+            Stored titles among the given articles
+        """
+        existing_titles: set[str] = set()
 
-            logger.info(f"Stored article: {article.title} (ID: {article_id})")
-            return article_id
+        for start in range(0, len(articles), DUPLICATE_LOOKUP_CHUNK):
+            chunk = articles[start : start + DUPLICATE_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            query = f"SELECT title FROM articles WHERE title IN ({placeholders})"
+            params = [article.title for article in chunk]
+            existing_titles.update(title for (title,) in conn.execute(query, params))
 
-        except sqlite3.Error as e:
-            logger.error(f"Database error storing article '{article.title}': {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error storing article '{article.title}': {e}")
-            return None
+        return existing_titles
 
-    def process_articles(self, articles: list[ArticleData]) -> list[int]:
-        """Process and store a batch of articles"""
-        logger.info(f"Processing {len(articles)} articles")
+    def _store_articles(
+        self, conn: Connection, articles: list[ArticleData]
+    ) -> tuple[dict[str, int], int]:
+        """
+        Store a batch of articles on the caller's connection and transaction.
 
-        if not articles:
-            return []
+        Rows whose URL is already stored are skipped by the database
+        (ON CONFLICT DO NOTHING) instead of failing the batch. If the multi-row
+        INSERT fails, the rows are retried one by one in the same transaction;
+        SQLite rolls back only the failing statement, so one bad row does not
+        drop the rest. Rows are inserted INSERT_PAGE_ROWS at a time, and only
+        the page that failed is retried.
 
-        stored_ids = []
-        conn = None
+        Returns:
+            (article_id by URL for the rows actually inserted, number of rows that failed)
+        """
+        payload = [
+            {
+                "title": article.title,
+                "source": article.source,
+                "url": article.url,
+                "published_at": article.published_at,
+                "raw_text": article.raw_text,
+            }
+            for article in articles
+        ]
+
+        if self._insert_stmt is None:
+            # SQLAlchemy's own executemany page size matches ours, so every
+            # execute below is a single multi-VALUES INSERT
+            self._insert_stmt = (
+                insert_ignoring_conflicts(Article, ["url"])
+                .returning(Article.article_id, Article.url)
+                .execution_options(insertmanyvalues_page_size=INSERT_PAGE_ROWS)
+            )
+        stmt = self._insert_stmt
+        ids_by_url: dict[str, int] = {}
+        failed = 0
+
+        for start in range(0, len(payload), INSERT_PAGE_ROWS):
+            page = payload[start : start + INSERT_PAGE_ROWS]
+            try:
+                result = conn.execute(stmt, page)
+                ids_by_url.update((url, article_id) for article_id, url in result)
+            except SQLAlchemyError as e:
+                logger.warning(
+                    f"Insert of {len(page)} articles failed, retrying per row: {e}"
+                )
+                for row in page:
+                    try:
+                        for article_id, url in conn.execute(stmt, [row]):
+                            ids_by_url[url] = article_id
+                    except SQLAlchemyError as e:
+                        logger.error(
+                            f"Database error storing article {row['url']}: {e}"
+                        )
+                        failed += 1
 
-        try:
-            conn = get_connection()
+        return ids_by_url, failed
 
-            new_articles = 0
-            duplicates = 0
-            errors = 0
+    async def process_articles(self, articles: list[ArticleData]) -> list[int]:
+        """Process and store a batch of articles without blocking the event loop"""
+        return await asyncio.to_thread(self._process_batch, articles)
 
-            for article in articles:
-                try:
-                    # Normalize the article
-                    normalized_article = self._normalize_article(article)
+    def _process_batch(self, articles: list[ArticleData]) -> list[int]:
+        """Process and store a batch of articles"""
+        logger.info(f"Processing {len(articles)} articles")
 
-                    # Check for duplicates
-                    if self._is_duplicate(conn, normalized_article):
-                        logger.debug(
-                            f"Duplicate article skipped: {normalized_article.title}"
-                        )
-                        duplicates += 1
-                        continue
-
-                    # Store the article
-                    article_id = self._store_article(conn, normalized_article)
-                    if article_id:
-                        stored_ids.append(article_id)
-                        new_articles += 1
-                    else:
-                        errors += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing individual article: {e}")
-                    errors += 1
-
-            logger.info(
-                f"Processing complete: {new_articles} new, {duplicates} duplicates, {errors} errors"
-            )
+        if not articles:
+            return []
 
-        except Exception as e:
-            logger.error(f"Error in process_articles: {e}")
-        finally:
-            if conn:
-                conn.close()
+        new_batch: list[ArticleData] = []
+        ids_by_url: dict[str, int] = {}
+        duplicates = 0
+        # Normalize before checking out a connection so the transaction only
+        # covers the database work
+        normalized_articles, errors = self._normalize_articles(articles)
+
+        # Cheap in-memory checks first: URLs we stored recently and repeats
+        # within this batch never reach the database lookup
+        candidates: list[ArticleData] = []
+        batch_urls: set[str] = set()
+        for article in normalized_articles:
+            if article.url in self._processed_urls or article.url in batch_urls:
+                logger.debug("Duplicate article skipped: {}", article.title)
+                duplicates += 1
+                continue
+            batch_urls.add(article.url)
+            candidates.append(article)
+
+        # Skip the database entirely when everything was a known duplicate
+        if candidates:
+            # Counts to fall back to if the transaction below rolls back
+            errors_before = errors
+            duplicates_before = duplicates
+            try:
+                # One pooled connection and one transaction per batch, shared by
+                # the duplicate checks and the INSERT
+                with self._write_lock, engine.begin() as conn:
+                    # One title lookup for the remaining articles instead of a
+                    # query each; stored URLs are skipped by the INSERT itself
+                    existing_titles = self._find_existing_titles(
+                        conn.connection, candidates
+                    )
+
+                    # Titles repeated within this batch count as duplicates too
+                    batch_titles: set[str] = set()
+                    for article in candidates:
+                        if (
+                            article.title in existing_titles
+                            or article.title in batch_titles
+                        ):
+                            logger.debug("Duplicate article skipped: {}", article.title)
+                            duplicates += 1
+                            continue
+                        batch_titles.add(article.title)
+                        new_batch.append(article)
+
+                    # Store the new articles
+                    if new_batch:
+                        ids_by_url, failed = self._store_articles(conn, new_batch)
+                        errors += failed
+                        # Rows the INSERT skipped were stored by someone else already
+                        duplicates += len(new_batch) - len(ids_by_url) - failed
+
+            except Exception as e:
+                logger.error(f"Error in process_articles: {e}")
+                # The transaction rolled back: nothing from this batch was stored,
+                # so every candidate that reached the database is an error
+                errors = errors_before + len(candidates)
+                duplicates = duplicates_before
+                new_batch = []
+                ids_by_url = {}
+
+        stored = [
+            (article.title, ids_by_url[article.url])
+            for article in new_batch
+            if article.url in ids_by_url
+        ]
+        stored_ids = [article_id for _, article_id in stored]
+        # Per-article detail only when debugging; the summary below is always logged
+        logger.opt(lazy=True).debug(
+            "Stored articles: {}",
+            lambda: ", ".join(
+                f"{title} (ID: {article_id})" for title, article_id in stored
+            ),
+        )
+
+        if ids_by_url:
+            # Add to processed URLs set
+            self._remember_urls(ids_by_url)
+            # New rows make the cached counts/recent lists stale
+            self._read_cache.clear()
+
+        logger.info(
+            f"Processing complete: {len(stored_ids)} new, {duplicates} duplicates, {errors} errors"
+        )
 
         return stored_ids
 
     def get_recent_articles(self, limit: int = 10) -> list[dict]:
         """Get recently stored articles for verification"""
+        cache_key = ("recent_articles", limit)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         conn = None
         try:
-            conn = get_connection()
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            conn = get_raw_connection()
+            cursor = conn.execute(_RECENT_ARTICLES_SQL, (limit,))
+            columns = [col[0] for col in cursor.description]
 
-            query = """
-            SELECT article_id, title, source, url, published_at, created_at
-            FROM articles
-            ORDER BY created_at DESC
-            LIMIT ?
-            """
-
-            cursor.execute(query, (limit,))
-            results = cursor.fetchall()
-
-            return [dict(row) for row in results]
+            recent = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            self._set_cached(cache_key, recent)
+            return recent
 
         except Exception as e:
             logger.error(f"Error getting recent articles: {e}")
@@ -204,12 +345,17 @@ class ArticlePipeline:
 
     def get_article_count(self) -> int:
         """Get total number of articles in database"""
+        cache_key = ("article_count",)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
         conn = None
         try:
-            conn = get_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM articles")
-            return cursor.fetchone()[0]
+            conn = get_raw_connection()
+            count = conn.execute(_ARTICLE_COUNT_SQL).fetchone()[0]
+            self._set_cached(cache_key, count)
+            return count
         except Exception as e:
             logger.error(f"Error getting article count: {e}")
             return 0
@@ -33,7 +33,7 @@ class JobScheduler:
 
                 if articles:
                     # Process and store articles
-                    stored_ids = self.pipeline.process_articles(articles)
+                    stored_ids = await self.pipeline.process_articles(articles)
                     logger.info(
                         f"{job_name} job completed: {len(stored_ids)} articles stored"
                     )
@@ -120,7 +120,7 @@ class JobScheduler:
         try:
             articles = await self.fetcher.fetch_all_sources()
             if articles:
-                stored_ids = self.pipeline.process_articles(articles)
+                stored_ids = await self.pipeline.process_articles(articles)
                 logger.info(
                     f"Single fetch completed: {len(stored_ids)} articles stored"
                 )
@@ -1,7 +1,21 @@
 import os
 import sys
 
+import pytest
+
 # Add the src directory to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 src_path = os.path.join(project_root, "src")
 sys.path.insert(0, src_path)
+
+
+@pytest.fixture(autouse=True)
+def reset_gemini_client():
+    """Drop the cached summarization client so each test sees its own mock"""
+    from veritas_news.ai import summarization
+
+    summarization._GEMINI_CLIENT = None
+    summarization._GEMINI_CLIENT_API_KEY = None
+    yield
+    summarization._GEMINI_CLIENT = None
+    summarization._GEMINI_CLIENT_API_KEY = None
@@ -1,6 +1,8 @@
 """Unit tests for summarization library functions."""
 
 import os
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 from fastapi import HTTPException
@@ -100,3 +102,31 @@ def test_summarize_with_gemini_empty_response():
         finally:
             del os.environ["GEMINI_API_KEY"]
 
+
+
+def test_get_gemini_client_builds_one_client_across_threads():
+    """Test that concurrent first calls share a single Gemini client"""
+
+    def slow_client(api_key):
+        # Widen the window between the check and the assignment
+        time.sleep(0.01)
+        return MagicMock()
+
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def get_client():
+        barrier.wait()
+        clients.append(summarization.get_gemini_client("test_key"))
+
+    with patch(
+        "veritas_news.ai.summarization.genai.Client", side_effect=slow_client
+    ) as mock_client_class:
+        threads = [threading.Thread(target=get_client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_client_class.call_count == 1
+    assert all(client is clients[0] for client in clients)
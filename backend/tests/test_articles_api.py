@@ -7,6 +7,7 @@ Tests filtering, pagination, and response structure for /articles/latest endpoin
 from datetime import UTC, datetime, timedelta
 import os
 import tempfile
+from unittest.mock import AsyncMock, patch
 
 from fastapi.testclient import TestClient
 import pytest
@@ -298,3 +299,38 @@ class TestArticlesLatestEndpoint:
         response = client.get("/articles/latest?offset=-1")
 
         assert response.status_code == 422  # Validation error
+
+
+class TestFetchEndpoint:
+    """Test the /articles/fetch endpoint"""
+
+    @pytest.fixture
+    def mock_worker(self, monkeypatch):
+        """Patch NewsWorker in the route module and authorize requests"""
+        monkeypatch.setenv("CRON_SECRET", "test-secret")
+        with patch("veritas_news.api.routes_articles.NewsWorker") as worker_class:
+            worker = worker_class.return_value
+            worker.run_single_fetch = AsyncMock(return_value=3)
+            worker.aclose = AsyncMock()
+            yield worker
+
+    def test_fetch_closes_worker(self, mock_worker):
+        """Test that the per-request worker's HTTP client is closed"""
+        response = TestClient(app).get(
+            "/articles/fetch", headers={"Authorization": "Bearer test-secret"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["fetched"] == 3
+        mock_worker.aclose.assert_awaited_once()
+
+    def test_fetch_closes_worker_on_error(self, mock_worker):
+        """Test that the worker is closed even when the fetch fails"""
+        mock_worker.run_single_fetch.side_effect = RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError):
+            TestClient(app).get(
+                "/articles/fetch", headers={"Authorization": "Bearer test-secret"}
+            )
+
+        mock_worker.aclose.assert_awaited_once()
@@ -5,50 +5,158 @@ Tests the /analyze endpoint that calls the AI library functions and stores resul
 
 from datetime import UTC, datetime
 import os
+import sqlite3
 from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from veritas_news.db.sqlalchemy import Base
+from veritas_news.db import bias_rating_db
+from veritas_news.db.sqlalchemy import Base, get_session
 from veritas_news.main import app
 from veritas_news.models.sqlalchemy_models import Article, BiasRating
 
+# Fixed timestamp for seeded rows; no test here depends on the current time
+FAKE_NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
 
-@pytest.fixture
-def test_db():
-    """Create an in-memory test database with sample data using SQLAlchemy"""
-    # Create in-memory SQLite database
+
+@pytest.fixture(scope="module")
+def test_engine():
+    """Create the in-memory schema once per module"""
+    # One shared connection (StaticPool) so every session sees the same database
     engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
-    TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # Let SQLAlchemy emit BEGIN itself: pysqlite's implicit transactions would
+    # otherwise make each SAVEPOINT RELEASE commit to the database
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_begin(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
-    # Create a session
-    db = TestSessionLocal()
+    Base.metadata.create_all(bind=engine)
 
     try:
-        # Insert test article with content
-        test_article = Article(
+        yield engine
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def seeded_articles(test_engine) -> dict[str, int]:
+    """Seed the articles the tests pick from, in one commit per module"""
+    with Session(test_engine) as db:
+        # Article with content (ID 1) that has no bias rating yet
+        with_text = Article(
             title="Test Article",
             source="Test Source",
             url="https://test.com/article",
             raw_text="This is test article content for bias analysis.",
-            created_at=datetime.now(UTC),
+            created_at=FAKE_NOW,
+        )
+        # Article without raw_text
+        empty = Article(
+            title="Empty Article",
+            source="Test",
+            url="https://test.com/empty",
+            raw_text="",
+            created_at=FAKE_NOW,
+        )
+        # Article that already has a multi-dimensional bias rating
+        rated = Article(
+            title="Rated Article",
+            source="Test Source",
+            url="https://test.com/rated",
+            raw_text="This article has already been analyzed for bias.",
+            created_at=FAKE_NOW,
         )
-        db.add(test_article)
+        db.add_all([with_text, empty, rated])
+        db.flush()
+        rating = BiasRating(
+            article_id=rated.article_id,
+            bias_score=4.5,
+            partisan_bias=3.0,
+            affective_bias=4.0,
+            framing_bias=5.0,
+            sourcing_bias=6.0,
+            reasoning="Existing analysis",
+            evaluated_at=FAKE_NOW,
+        )
+        db.add(rating)
         db.commit()
-        db.refresh(test_article)
 
+        return {
+            "with_text": with_text.article_id,
+            "empty": empty.article_id,
+            "rated": rated.article_id,
+            "rating": rating.rating_id,
+            "missing": 999,
+        }
+
+
+@pytest.fixture
+def test_db(test_engine, seeded_articles):
+    """Session whose commits are rolled back after the test"""
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    # Commits inside the test only release savepoints of the outer transaction
+    db = Session(
+        bind=connection,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+    try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="module")
+def sqlite_template() -> bytes:
+    """Build the seeded sqlite3 schema once per module as a serialized image"""
+    conn = sqlite3.connect(":memory:")
+
+    try:
+        # Build the schema from the SQLAlchemy models on the same connection
+        Base.metadata.create_all(bind=create_engine("sqlite://", creator=lambda: conn))
+
+        conn.execute(
+            "INSERT INTO articles (title, source, created_at) "
+            "VALUES ('Test Article', 'Test Source', CURRENT_TIMESTAMP)"
+        )
+        conn.execute(
+            "INSERT INTO bias_ratings (article_id, bias_score, reasoning, evaluated_at) "
+            "VALUES (1, 0.5, 'Test reasoning', '2024-01-01 12:00:00')"
+        )
+        conn.commit()
+        return conn.serialize()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def sqlite_db(sqlite_template):
+    """Create an in-memory sqlite3 connection for the raw bias_rating_db helpers"""
+    # Each test gets a private copy of the template, so no DDL runs per test
+    conn = sqlite3.connect(":memory:")
+    conn.deserialize(sqlite_template)
+
+    try:
+        yield conn
+    finally:
+        conn.close()
 
 
 @pytest.fixture
@@ -57,112 +165,59 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def client_with_db(client, test_db):
+    """Test client whose requests use the test_db session"""
+    app.dependency_overrides[get_session] = lambda: test_db
+    try:
+        yield client
+    finally:
+        app.dependency_overrides.pop(get_session, None)
+
+
 class TestAnalyzeEndpoint:
     """Test the /bias_ratings/analyze endpoint"""
 
-    def test_analyze_article_not_found(self, test_db, client):
+    def test_analyze_article_not_found(self, seeded_articles, client_with_db):
         """Test analyzing a non-existent article"""
-        from veritas_news.db.sqlalchemy import get_session
-
-        def override_get_session():
-            try:
-                yield test_db
-            finally:
-                pass
-
-        app.dependency_overrides[get_session] = override_get_session
-
-        try:
-            response = client.post("/bias_ratings/analyze", json={"article_id": 999})
-            assert response.status_code == 404
-            assert "not found" in response.json()["detail"].lower()
-        finally:
-            app.dependency_overrides.clear()
+        response = client_with_db.post(
+            "/bias_ratings/analyze", json={"article_id": seeded_articles["missing"]}
+        )
+        assert response.status_code == 404
+        assert "not found" in response.json()["detail"].lower()
 
-    def test_analyze_article_no_content(self, test_db, client):
+    def test_analyze_article_no_content(self, seeded_articles, client_with_db):
         """Test analyzing an article with no text content"""
-        # Create article without raw_text
-        article = Article(
-            title="Empty Article",
-            source="Test",
-            url="https://test.com/empty",
-            raw_text="",
-            created_at=datetime.now(UTC),
+        response = client_with_db.post(
+            "/bias_ratings/analyze", json={"article_id": seeded_articles["empty"]}
         )
-        test_db.add(article)
-        test_db.commit()
-        test_db.refresh(article)
-
-        from veritas_news.db.sqlalchemy import get_session
-
-        def override_get_session():
-            try:
-                yield test_db
-            finally:
-                pass
+        assert response.status_code == 422
+        assert "no text content" in response.json()["detail"].lower()
 
-        app.dependency_overrides[get_session] = override_get_session
-
-        try:
-            response = client.post(
-                "/bias_ratings/analyze", json={"article_id": article.article_id}
-            )
-            assert response.status_code == 422
-            assert "no text content" in response.json()["detail"].lower()
-        finally:
-            app.dependency_overrides.clear()
-
-    def test_analyze_returns_existing_rating(self, test_db, client):
+    def test_analyze_returns_existing_rating(self, seeded_articles, client_with_db):
         """Test that analyzing an already-analyzed article returns existing rating"""
-        # Create existing bias rating with multi-dimensional scores
-        existing_rating = BiasRating(
-            article_id=1,
-            bias_score=4.5,
-            partisan_bias=3.0,
-            affective_bias=4.0,
-            framing_bias=5.0,
-            sourcing_bias=6.0,
-            reasoning="Existing analysis",
-            evaluated_at=datetime.now(UTC),
+        # The seeded "rated" article already has multi-dimensional scores
+        response = client_with_db.post(
+            "/bias_ratings/analyze", json={"article_id": seeded_articles["rated"]}
         )
-        test_db.add(existing_rating)
-        test_db.commit()
-        test_db.refresh(existing_rating)
-
-        from veritas_news.db.sqlalchemy import get_session
-
-        def override_get_session():
-            try:
-                yield test_db
-            finally:
-                pass
-
-        app.dependency_overrides[get_session] = override_get_session
-
-        try:
-            response = client.post("/bias_ratings/analyze", json={"article_id": 1})
 
-            # Should return existing rating without calling the AI function
-            assert response.status_code == 200
-            data = response.json()
-            assert data["rating_id"] == existing_rating.rating_id
-            # bias_score is normalized from 1-7 scale to -1 to 1 scale
-            # Average of (3+4+5+6)/4 = 4.5, normalized: (4.5-4)/3 = 0.167
-            assert abs(data["bias_score"] - 0.167) < 0.01
-            assert data["reasoning"] == "Existing analysis"
-            # Verify multi-dimensional scores
-            assert data["partisan_bias"] == 3.0
-            assert data["affective_bias"] == 4.0
-            assert data["framing_bias"] == 5.0
-            assert data["sourcing_bias"] == 6.0
-        finally:
-            app.dependency_overrides.clear()
+        # Should return existing rating without calling the AI function
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rating_id"] == seeded_articles["rating"]
+        # bias_score is normalized from 1-7 scale to -1 to 1 scale
+        # Average of (3+4+5+6)/4 = 4.5, normalized: (4.5-4)/3 = 0.167
+        assert abs(data["bias_score"] - 0.167) < 0.01
+        assert data["reasoning"] == "Existing analysis"
+        # Verify multi-dimensional scores
+        assert data["partisan_bias"] == 3.0
+        assert data["affective_bias"] == 4.0
+        assert data["framing_bias"] == 5.0
+        assert data["sourcing_bias"] == 6.0
 
     @patch("veritas_news.ai.bias_analysis.genai.Client")
-    def test_analyze_success(self, mock_client_class, test_db, client):
+    def test_analyze_success(self, mock_client_class, client_with_db):
         """Test successful bias analysis - integration test with mocked Gemini API"""
-        from veritas_news.db.sqlalchemy import get_session
-
         # Mock the Gemini client (external API)
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
@@ -188,16 +243,10 @@ class TestAnalyzeEndpoint:
         original_key = os.environ.get("GEMINI_API_KEY")
         os.environ["GEMINI_API_KEY"] = "test_key"
 
-        def override_get_session():
-            try:
-                yield test_db
-            finally:
-                pass
-
-        app.dependency_overrides[get_session] = override_get_session
-
         try:
-            response = client.post("/bias_ratings/analyze", json={"article_id": 1})
+            response = client_with_db.post(
+                "/bias_ratings/analyze", json={"article_id": 1}
+            )
 
             assert response.status_code == 200
             data = response.json()
@@ -227,7 +276,6 @@ class TestAnalyzeEndpoint:
             # Verify Gemini was called (4 legacy + 22 SECM = 26 times)
             assert mock_client.models.generate_content.call_count == 26
         finally:
-            app.dependency_overrides.clear()
             # Restore original key
             if original_key:
                 os.environ["GEMINI_API_KEY"] = original_key
@@ -235,10 +283,8 @@ class TestAnalyzeEndpoint:
                 del os.environ["GEMINI_API_KEY"]
 
     @patch("veritas_news.ai.bias_analysis.genai.Client")
-    def test_analyze_gemini_api_failure(self, mock_client_class, test_db, client):
+    def test_analyze_gemini_api_failure(self, mock_client_class, client_with_db):
         """Test that Gemini API failure returns 502"""
-        from veritas_news.db.sqlalchemy import get_session
-
         # Mock Gemini API to raise error
         mock_client = MagicMock()
         mock_client_class.return_value = mock_client
@@ -247,21 +293,14 @@ class TestAnalyzeEndpoint:
         original_key = os.environ.get("GEMINI_API_KEY")
         os.environ["GEMINI_API_KEY"] = "test_key"
 
-        def override_get_session():
-            try:
-                yield test_db
-            finally:
-                pass
-
-        app.dependency_overrides[get_session] = override_get_session
-
         try:
-            response = client.post("/bias_ratings/analyze", json={"article_id": 1})
+            response = client_with_db.post(
+                "/bias_ratings/analyze", json={"article_id": 1}
+            )
 
             assert response.status_code == 502
             assert "Bias rating failed" in response.json()["detail"]
         finally:
-            app.dependency_overrides.clear()
             # Restore original key
             if original_key:
                 os.environ["GEMINI_API_KEY"] = original_key
@@ -282,7 +321,7 @@ class TestDatabaseOperations:
             framing_bias=5.0,
             sourcing_bias=6.0,
             reasoning="Test direct creation",
-            evaluated_at=datetime.now(UTC),
+            evaluated_at=FAKE_NOW,
         )
         test_db.add(rating)
         test_db.commit()
@@ -303,7 +342,7 @@ class TestDatabaseOperations:
             article_id=1,
             bias_score=0.2,
             reasoning="Test query",
-            evaluated_at=datetime.now(UTC),
+            evaluated_at=FAKE_NOW,
         )
         test_db.add(rating)
         test_db.commit()
@@ -316,5 +355,91 @@ class TestDatabaseOperations:
         assert result.bias_score == 0.2
 
 
+class TestBiasRatingDb:
+    """Test the raw sqlite3 bias_rating_db helpers"""
+
+    def test_get_all_bias_ratings_paginates(self, sqlite_db):
+        """Test limit/offset paging, newest first, and the COUNT helper"""
+        sqlite_db.executemany(
+            "INSERT INTO bias_ratings (article_id, bias_score, reasoning, evaluated_at) "
+            "VALUES (1, ?, 'Paged', ?)",
+            [(0.1, "2024-01-02 12:00:00"), (0.2, "2024-01-03 12:00:00")],
+        )
+        sqlite_db.commit()
+
+        page = bias_rating_db.get_all_bias_ratings(sqlite_db, limit=2)
+        assert [r["bias_score"] for r in page] == [0.2, 0.1]
+
+        page = bias_rating_db.get_all_bias_ratings(sqlite_db, limit=2, offset=2)
+        assert [r["bias_score"] for r in page] == [0.5]
+
+        assert bias_rating_db.count_bias_ratings(sqlite_db) == 3
+
+    def test_get_all_bias_ratings_clamps_paging(self, sqlite_db, monkeypatch):
+        """Test that out-of-range limit/offset values are clamped"""
+        sqlite_db.executemany(
+            "INSERT INTO bias_ratings (article_id, bias_score, reasoning, evaluated_at) "
+            "VALUES (1, ?, 'Paged', ?)",
+            [(0.1, "2024-01-02 12:00:00"), (0.2, "2024-01-03 12:00:00")],
+        )
+        sqlite_db.commit()
+        monkeypatch.setattr(bias_rating_db, "MAX_PAGE_SIZE", 2)
+
+        # A negative LIMIT would otherwise return every row
+        page = bias_rating_db.get_all_bias_ratings(sqlite_db, limit=-1)
+        assert [r["bias_score"] for r in page] == [0.2]
+
+        page = bias_rating_db.get_all_bias_ratings(sqlite_db, limit=0)
+        assert len(page) == 1
+
+        page = bias_rating_db.get_all_bias_ratings(sqlite_db, limit=100, offset=-5)
+        assert [r["bias_score"] for r in page] == [0.2, 0.1]
+
+    def test_helpers_leave_connection_row_factory_alone(self, sqlite_db):
+        """Test that the read helpers return dicts without changing the connection"""
+        assert bias_rating_db.get_all_bias_ratings(sqlite_db)[0]["rating_id"] == 1
+        assert bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)["rating_id"] == 1
+
+        assert sqlite_db.row_factory is None
+        row = sqlite_db.execute("SELECT rating_id FROM bias_ratings").fetchone()
+        assert row == (1,)
+
+    def test_update_bias_rating_success(self, sqlite_db):
+        """Test updating both fields of an existing rating"""
+        assert bias_rating_db.update_bias_rating(
+            sqlite_db, 1, bias_score=-0.25, reasoning="Updated reasoning"
+        )
+
+        rating = bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)
+        assert rating["bias_score"] == -0.25
+        assert rating["reasoning"] == "Updated reasoning"
+
+    def test_update_bias_rating_single_field(self, sqlite_db):
+        """Test that updating one field leaves the other untouched"""
+        assert bias_rating_db.update_bias_rating(sqlite_db, 1, bias_score=0.75)
+        rating = bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)
+        assert rating["bias_score"] == 0.75
+        assert rating["reasoning"] == "Test reasoning"
+
+        assert bias_rating_db.update_bias_rating(sqlite_db, 1, reasoning="Only reasoning")
+        rating = bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)
+        assert rating["bias_score"] == 0.75
+        assert rating["reasoning"] == "Only reasoning"
+
+    def test_update_bias_rating_not_found(self, sqlite_db):
+        """Test updating a non-existent rating reports failure"""
+        assert not bias_rating_db.update_bias_rating(sqlite_db, 999, bias_score=0.1)
+
+    def test_update_bias_rating_empty_patch_skips_write(self, sqlite_db):
+        """Test that an update with no fields set leaves the row untouched"""
+        before = bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)
+
+        assert bias_rating_db.update_bias_rating(sqlite_db, 1)
+
+        after = bias_rating_db.get_bias_rating_by_id(sqlite_db, 1)
+        assert after == before
+        assert after["evaluated_at"] == datetime(2024, 1, 1, 12, 0, 0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
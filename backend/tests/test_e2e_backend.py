@@ -1,8 +1,9 @@
 """
 End-to-End Test for Backend Application
 
-This test starts the actual FastAPI backend server and makes real HTTP requests to it.
-This is the closest thing to testing how a user would interact with the application.
+A smoke test starts the actual FastAPI backend server under uvicorn and makes a real
+HTTP request to it. The remaining tests drive the same app in-process through
+TestClient against a real temporary database, skipping the server startup cost.
 
 The backend now uses the AI library directly (no separate microservice).
 
@@ -10,11 +11,12 @@ WARNING: Makes real API calls to Gemini and will incur costs.
 Requires GEMINI_API_KEY to be set in environment.
 """
 
+import asyncio
 import os
 from pathlib import Path
+import socket
 import subprocess
 import sys
-import time
 
 import httpx
 import pytest
@@ -28,7 +30,7 @@ if env_path.exists():
     load_dotenv(dotenv_path=env_path)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def e2e_test_db():
     """Create a test database for E2E testing"""
     import tempfile
@@ -37,8 +39,10 @@ def e2e_test_db():
 
     from veritas_news.models.sqlalchemy_models import Base
 
-    # Create temporary database file
-    fd, db_path = tempfile.mkstemp(suffix=".db")
+    # Create temporary database file. The backend runs in a subprocess, so an
+    # in-memory database cannot be shared; use tmpfs when available instead
+    shm_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, db_path = tempfile.mkstemp(suffix=".db", dir=shm_dir)
     os.close(fd)
 
     # Create tables
@@ -48,17 +52,27 @@ def e2e_test_db():
 
     yield db_path
 
-    # Cleanup: remove test database
-    if os.path.exists(db_path):
-        os.unlink(db_path)
+    # Cleanup: remove test database and the server's WAL side files
+    for path in (db_path, f"{db_path}-wal", f"{db_path}-shm"):
+        if os.path.exists(path):
+            os.unlink(path)
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def backend_server(e2e_test_db):
-    """Start the main backend FastAPI server for E2E testing with test database"""
-    # Set DB_PATH so backend uses test database
-    old_db_path = os.environ.get("DB_PATH")
-    os.environ["DB_PATH"] = e2e_test_db
+    """
+    Start the main backend FastAPI server for E2E testing with test database.
+
+    Yields the server's base URL. The port is picked by the OS and DB_PATH is
+    passed only to the child process, so parallel pytest-xdist workers each get
+    an isolated server and database.
+    """
+    # Bind the listening socket here and hand it to uvicorn: connections made
+    # before the app is up wait in the backlog instead of being refused
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.listen()
+    base_url = f"http://127.0.0.1:{sock.getsockname()[1]}"
 
     # Start uvicorn server in background
     process = subprocess.Popen(
@@ -67,53 +81,92 @@ def backend_server(e2e_test_db):
             "-m",
             "uvicorn",
             "veritas_news.main:app",
-            "--host",
-            "127.0.0.1",
-            "--port",
-            "8002",  # Use different port to avoid conflicts
+            "--fd",
+            str(sock.fileno()),
             "--log-level",
             "error",  # Suppress server logs in test output
         ],
         cwd=project_root,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        env=os.environ.copy(),  # Pass environment including DB_PATH
+        env={**os.environ, "DB_PATH": e2e_test_db},  # Backend uses test database
+        pass_fds=(sock.fileno(),),
     )
-
-    # Wait for server to start
-    max_attempts = 30
-    for _ in range(max_attempts):
-        try:
-            response = httpx.get("http://127.0.0.1:8002/", timeout=1.0)
-            if response.status_code == 200:
-                break
-        except (httpx.ConnectError, httpx.TimeoutException):
-            time.sleep(0.5)
-    else:
+    # Only the server holds the socket now, so a crashed server refuses requests
+    sock.close()
+
+    # Wait for server to start: the first request is answered once it is ready
+    try:
+        response = httpx.get(f"{base_url}/", timeout=15.0)
+        started = response.status_code == 200
+    except httpx.HTTPError:
+        started = False
+    if not started:
         process.terminate()
         process.wait()
         pytest.fail("Backend server failed to start within timeout")
 
-    yield process
+    yield base_url
 
     # Cleanup: stop server
     process.terminate()
     process.wait(timeout=5)
 
-    # Restore original DB_PATH
-    if old_db_path:
-        os.environ["DB_PATH"] = old_db_path
-    elif "DB_PATH" in os.environ:
-        del os.environ["DB_PATH"]
+
+@pytest.fixture(scope="session")
+def e2e_engine(e2e_test_db):
+    """One pooled engine on the E2E database, shared by the app and the tests"""
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine(
+        f"sqlite:///{e2e_test_db}", connect_args={"check_same_thread": False}
+    )
+
+    # Throwaway database: skip fsync on commit (the in-process app commits
+    # through this engine too)
+    @event.listens_for(engine, "connect")
+    def _set_test_pragmas(dbapi_conn, connection_record):
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=OFF",
+            "PRAGMA temp_store=MEMORY",
+        ):
+            dbapi_conn.execute(pragma)
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def http_client(e2e_engine):
+    """In-process client for the backend app, backed by the E2E test database"""
+    from fastapi.testclient import TestClient
+    from sqlalchemy.orm import sessionmaker
+
+    from veritas_news.db.sqlalchemy import get_session
+    from veritas_news.main import app
+
+    E2ESessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=e2e_engine)
+
+    def override_get_session():
+        db = E2ESessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # Module scope keeps the override from leaking into other test modules
+    app.dependency_overrides[get_session] = override_get_session
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_session, None)
 
 
 @pytest.mark.e2e
 def test_backend_health(backend_server):
-    """E2E test: Verify backend server health endpoint works"""
-    base_url = "http://127.0.0.1:8002"
-
-    with httpx.Client(timeout=5.0) as client:
-        resp = client.get(f"{base_url}/")
+    """E2E smoke test: Verify the real uvicorn server answers its health endpoint"""
+    resp = httpx.get(f"{backend_server}/", timeout=5.0)
 
     assert resp.status_code == 200
     data = resp.json()
@@ -122,7 +175,7 @@ def test_backend_health(backend_server):
 
 
 @pytest.mark.e2e
-def test_summarize_e2e(backend_server):
+def test_summarize_e2e(http_client):
     """
     End-to-end test for summarization: Makes real HTTP request to running server.
 
@@ -133,7 +186,6 @@ def test_summarize_e2e(backend_server):
     - Response is valid JSON with correct structure
     - Summary is generated
     """
-    base_url = "http://127.0.0.1:8002"
 
     # Test article
     test_article = """
@@ -146,11 +198,10 @@ def test_summarize_e2e(backend_server):
     """
 
     # Make real HTTP request to running server
-    with httpx.Client(timeout=60.0) as client:
-        resp = client.post(
-            f"{base_url}/bias_ratings/summarize",
-            json={"article_text": test_article.strip()},
-        )
+    resp = http_client.post(
+        "/bias_ratings/summarize",
+        json={"article_text": test_article.strip()},
+    )
 
     # Assert successful HTTP response
     assert (
@@ -171,14 +222,10 @@ def test_summarize_e2e(backend_server):
 
 
 @pytest.mark.e2e
-def test_summarize_e2e_validation_error(backend_server):
+def test_summarize_e2e_validation_error(http_client):
     """E2E test for error handling - empty article text"""
-    base_url = "http://127.0.0.1:8002"
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(
-            f"{base_url}/bias_ratings/summarize", json={"article_text": ""}
-        )
+    resp = http_client.post("/bias_ratings/summarize", json={"article_text": ""})
 
     # Should return validation error
     assert (
@@ -187,7 +234,7 @@ def test_summarize_e2e_validation_error(backend_server):
 
 
 @pytest.mark.e2e
-def test_bias_analysis_e2e_with_real_article(backend_server, e2e_test_db):
+def test_bias_analysis_e2e_with_real_article(http_client, e2e_engine):
     """
     End-to-end test for bias analysis: Complete flow with database.
 
@@ -200,16 +247,12 @@ def test_bias_analysis_e2e_with_real_article(backend_server, e2e_test_db):
 
     This is a true end-to-end test that exercises the full stack.
     """
-    base_url = "http://127.0.0.1:8002"
 
     # Create an article in the same database the backend uses
-    from sqlalchemy import create_engine
     from sqlalchemy.orm import Session
 
     from veritas_news.models.sqlalchemy_models import Article, Summary
 
-    engine = create_engine(f"sqlite:///{e2e_test_db}")
-
     test_article_text = """
     The Senate passed a new bill today with bipartisan support.
     The legislation, which was introduced last month, aims to address climate change
@@ -220,7 +263,7 @@ def test_bias_analysis_e2e_with_real_article(backend_server, e2e_test_db):
     energy development.
     """
 
-    with Session(engine) as session:
+    with Session(e2e_engine) as session:
         # Create article without summary field (it's in a separate table)
         article = Article(
             title="Test Climate Bill Article",
@@ -241,11 +284,10 @@ def test_bias_analysis_e2e_with_real_article(backend_server, e2e_test_db):
         article_id = article.article_id
 
     # Make real HTTP request to running server for bias analysis
-    with httpx.Client(timeout=120.0) as client:  # Longer timeout for parallel LLM calls
-        resp = client.post(
-            f"{base_url}/bias_ratings/analyze",
-            json={"article_id": article_id},
-        )
+    resp = http_client.post(
+        "/bias_ratings/analyze",
+        json={"article_id": article_id},
+    )
 
     # Verify successful response
     assert resp.status_code == 200, f"Expected 200 OK, got {resp.status_code}: {resp.text}"
@@ -281,14 +323,10 @@ def test_bias_analysis_e2e_with_real_article(backend_server, e2e_test_db):
 
 
 @pytest.mark.e2e
-def test_bias_analysis_e2e_article_not_found(backend_server):
+def test_bias_analysis_e2e_article_not_found(http_client):
     """E2E test: Verify proper error handling when article doesn't exist"""
-    base_url = "http://127.0.0.1:8002"
 
-    with httpx.Client(timeout=10.0) as client:
-        resp = client.post(
-            f"{base_url}/bias_ratings/analyze", json={"article_id": 99999}
-        )
+    resp = http_client.post("/bias_ratings/analyze", json={"article_id": 99999})
 
     # Should return 404 (article not found)
     assert resp.status_code == 404, f"Expected 404, got {resp.status_code}: {resp.text}"
@@ -298,7 +336,7 @@ def test_bias_analysis_e2e_article_not_found(backend_server):
 
 
 @pytest.mark.e2e
-def test_full_cycle_article_workflow(backend_server, e2e_test_db):
+def test_full_cycle_article_workflow(http_client, e2e_engine):
     """
     COMPLETE END-TO-END WORKFLOW TEST
 
@@ -311,15 +349,11 @@ def test_full_cycle_article_workflow(backend_server, e2e_test_db):
 
     This tests the full database cycle with the new multi-dimensional bias scoring.
     """
-    from sqlalchemy import create_engine
     from sqlalchemy.orm import Session
 
     from veritas_news.models.sqlalchemy_models import Article, BiasRating
 
-    base_url = "http://127.0.0.1:8002"
-
     # STEP 1: Create an article in database
-    engine = create_engine(f"sqlite:///{e2e_test_db}")
 
     article_text = """
     Tesla reported record quarterly earnings today, driven by strong electric vehicle sales.
@@ -329,7 +363,7 @@ def test_full_cycle_article_workflow(backend_server, e2e_test_db):
     Stock analysts remain divided on long-term profitability.
     """
 
-    with Session(engine) as session:
+    with Session(e2e_engine) as session:
         article = Article(
             title="Tesla Q3 Earnings Report",
             url="https://example.com/tesla-earnings",
@@ -342,11 +376,10 @@ def test_full_cycle_article_workflow(backend_server, e2e_test_db):
         session.commit()
 
     # STEP 2: Call bias analysis endpoint (makes real API calls)
-    with httpx.Client(timeout=120.0) as client:
-        resp = client.post(
-            f"{base_url}/bias_ratings/analyze",
-            json={"article_id": article_id},
-        )
+    resp = http_client.post(
+        "/bias_ratings/analyze",
+        json={"article_id": article_id},
+    )
 
     assert resp.status_code == 200, f"Bias analysis failed: {resp.text}"
     analysis_response = resp.json()
@@ -357,7 +390,7 @@ def test_full_cycle_article_workflow(backend_server, e2e_test_db):
     assert set(scores.keys()) == {"partisan_bias", "affective_bias", "framing_bias", "sourcing_bias"}
 
     # STEP 3: Query back the article AND bias_rating from database
-    with Session(engine) as session:
+    with Session(e2e_engine) as session:
         # Fetch article
         stored_article = session.query(Article).filter(
             Article.article_id == article_id
@@ -417,7 +450,7 @@ def test_full_cycle_article_workflow(backend_server, e2e_test_db):
 
 
 @pytest.mark.e2e
-def test_database_persistence_and_retrieval(backend_server, e2e_test_db):
+async def test_database_persistence_and_retrieval(http_client, e2e_engine):
     """
     DATABASE PERSISTENCE TEST
 
@@ -427,7 +460,6 @@ def test_database_persistence_and_retrieval(backend_server, e2e_test_db):
     3. All 4 dimension scores are stored and retrievable
     4. Relationships work correctly
     """
-    from sqlalchemy import create_engine
     from sqlalchemy.orm import Session
 
     from veritas_news.models.bias_rating import (
@@ -437,9 +469,6 @@ def test_database_persistence_and_retrieval(backend_server, e2e_test_db):
     )
     from veritas_news.models.sqlalchemy_models import Article, BiasRating
 
-    base_url = "http://127.0.0.1:8002"
-    engine = create_engine(f"sqlite:///{e2e_test_db}")
-
     # Create multiple test articles (2 articles = ~240 seconds max, fits in e2e timeout)
     test_cases = [
         {
@@ -457,7 +486,7 @@ def test_database_persistence_and_retrieval(backend_server, e2e_test_db):
     article_ids = []
 
     # Create articles
-    with Session(engine) as session:
+    with Session(e2e_engine) as session:
         for test_case in test_cases:
             article = Article(
                 title=test_case["title"],
@@ -470,19 +499,26 @@ def test_database_persistence_and_retrieval(backend_server, e2e_test_db):
             article_ids.append(article.article_id)
         session.commit()
 
-    # Analyze each article (120 second timeout per request for parallel LLM calls)
-    rating_ids = []
-    with httpx.Client(timeout=120.0) as client:
-        for article_id in article_ids:
-            resp = client.post(
-                f"{base_url}/bias_ratings/analyze",
-                json={"article_id": article_id},
+    # Analyze the articles concurrently; each request is an independent set of
+    # LLM calls (120 second timeout per request for parallel LLM calls)
+    transport = httpx.ASGITransport(app=http_client.app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://testserver", timeout=120.0
+    ) as client:
+        responses = await asyncio.gather(
+            *(
+                client.post("/bias_ratings/analyze", json={"article_id": article_id})
+                for article_id in article_ids
             )
-            assert resp.status_code == 200, f"Failed to analyze article {article_id}: {resp.text}"
-            rating_ids.append(resp.json()["rating_id"])
+        )
+
+    rating_ids = []
+    for article_id, resp in zip(article_ids, responses):
+        assert resp.status_code == 200, f"Failed to analyze article {article_id}: {resp.text}"
+        rating_ids.append(resp.json()["rating_id"])
 
     # VERIFY: Query back all ratings and test utility functions
-    with Session(engine) as session:
+    with Session(e2e_engine) as session:
         from sqlalchemy.orm import joinedload
         for i, rating_id in enumerate(rating_ids):
             rating = session.query(BiasRating).options(
@@ -3,13 +3,14 @@ import tempfile
 from unittest.mock import patch
 
 import pytest
-from sqlalchemy import create_engine, event, inspect
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker
 
 from veritas_news.db.init_db import get_connection, init_db
 from veritas_news.db.sqlalchemy import Base
 from veritas_news.models.sqlalchemy_models import (
     Article,
+    InteractionAction,
     Summary,
     User,
     UserInteraction,
@@ -133,6 +134,44 @@ class TestInitDb:
         pk_constraint = inspector.get_pk_constraint("articles")
         assert pk_constraint["constrained_columns"] == ["article_id"]
 
+    def test_init_db_query_indexes(self):
+        """Test that the composite query indexes are created with the tables."""
+        engine = create_engine("sqlite:///:memory:")
+        Base.metadata.create_all(bind=engine)
+
+        inspector = inspect(engine)
+        article_indexes = {
+            idx["name"]: idx["column_names"]
+            for idx in inspector.get_indexes("articles")
+        }
+        bias_indexes = {
+            idx["name"]: idx["column_names"]
+            for idx in inspector.get_indexes("bias_ratings")
+        }
+        interaction_indexes = {
+            idx["name"]: idx["column_names"]
+            for idx in inspector.get_indexes("user_interactions")
+        }
+
+        assert article_indexes["ix_articles_title"] == ["title"]
+        assert article_indexes["ix_articles_created_at"] == ["created_at"]
+        assert article_indexes["ix_articles_source_created"] == [
+            "source",
+            "created_at",
+        ]
+        assert bias_indexes["ix_bias_ratings_article_evaluated"] == [
+            "article_id",
+            "evaluated_at",
+        ]
+        assert interaction_indexes["ix_user_interactions_user_interacted"] == [
+            "user_id",
+            "interacted_at",
+        ]
+        assert interaction_indexes["ix_user_interactions_article_interacted"] == [
+            "article_id",
+            "interacted_at",
+        ]
+
     def test_init_db_foreign_key_constraints(self):
         """Test that foreign key constraints are properly set up."""
         engine = create_engine("sqlite:///:memory:")
@@ -194,8 +233,8 @@ class TestInitDb:
             db.refresh(user)
             db.refresh(article)
 
-            # Test valid actions
-            valid_actions = ["viewed", "liked", "bookmarked"]
+            # Test valid actions (names and enum members are both accepted)
+            valid_actions = ["viewed", "liked", InteractionAction.BOOKMARKED]
             for action in valid_actions:
                 interaction = UserInteraction(
                     user_id=user.user_id, article_id=article.article_id, action=action
@@ -203,10 +242,17 @@ class TestInitDb:
                 db.add(interaction)
             db.commit()
 
+            stored = [i.action for i in db.query(UserInteraction).all()]
+            assert stored == [
+                InteractionAction.VIEWED,
+                InteractionAction.LIKED,
+                InteractionAction.BOOKMARKED,
+            ]
+
             # Test invalid action should raise an error
-            from sqlalchemy.exc import IntegrityError
+            from sqlalchemy.exc import IntegrityError, StatementError
 
-            with pytest.raises(IntegrityError):
+            with pytest.raises(StatementError):
                 invalid_interaction = UserInteraction(
                     user_id=user.user_id,
                     article_id=article.article_id,
@@ -214,6 +260,18 @@ class TestInitDb:
                 )
                 db.add(invalid_interaction)
                 db.commit()
+            db.rollback()
+
+            # Out-of-range codes written directly are rejected by the CHECK
+            with pytest.raises(IntegrityError):
+                db.execute(
+                    text(
+                        "INSERT INTO user_interactions (user_id, article_id, action) "
+                        "VALUES (:user_id, :article_id, 7)"
+                    ),
+                    {"user_id": user.user_id, "article_id": article.article_id},
+                )
+                db.commit()
         finally:
             db.close()
 
@@ -232,6 +290,19 @@ class TestInitDb:
         result = init_db()
         assert result is True
 
+    def test_models_register_single_schema(self):
+        """Test that each table is declared by exactly one mapped class."""
+        mapped_tables = [mapper.local_table.name for mapper in Base.registry.mappers]
+
+        assert sorted(mapped_tables) == sorted(set(mapped_tables))
+        assert set(Base.metadata.tables) == {
+            "users",
+            "articles",
+            "summaries",
+            "bias_ratings",
+            "user_interactions",
+        }
+
 
 class TestIntegration:
     """Integration tests combining get_connection and init_db."""
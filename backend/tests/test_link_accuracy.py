@@ -741,6 +741,68 @@ class TestRSSFetcherURLs:
         assert len(articles) == 1
         assert articles[0].url == "https://news.example.com/article/123"
 
+    @pytest.mark.asyncio
+    async def test_rss_fetcher_extracts_urls_from_atom_feed(self):
+        """Test that Atom entries use their alternate link href as the URL"""
+        from veritas_news.worker.fetchers import RSSFetcher
+
+        mock_atom_content = """<?xml version="1.0" encoding="utf-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <title>Atom News Feed</title>
+            <entry>
+                <title>Atom Article</title>
+                <link rel="alternate" href="https://news.example.com/atom/789"/>
+                <id>tag:news.example.com,2024:789</id>
+                <updated>2024-11-30T12:00:00Z</updated>
+                <summary>Atom summary</summary>
+            </entry>
+        </feed>
+        """
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = mock_atom_content
+        mock_response.raise_for_status = MagicMock()
+
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_instance = AsyncMock()
+            mock_instance.get = AsyncMock(return_value=mock_response)
+            mock_instance.__aenter__ = AsyncMock(return_value=mock_instance)
+            mock_instance.__aexit__ = AsyncMock(return_value=None)
+            mock_client.return_value = mock_instance
+
+            fetcher = RSSFetcher(feeds=["https://example.com/feed.atom"], limit_per_feed=5)
+            articles = await fetcher.fetch_articles()
+
+        assert len(articles) == 1
+        assert articles[0].url == "https://news.example.com/atom/789"
+        assert articles[0].source == "Atom News Feed"
+        assert articles[0].published_at == datetime(2024, 11, 30, 12, 0, tzinfo=UTC)
+
+    @pytest.mark.parametrize(
+        "feed_text",
+        [
+            """<rss version="2.0"><channel><title>Test News Feed</title><item>
+                <title>Markup Article</title>
+                <link>https://news.example.com/markup</link>
+                <description>&lt;p&gt;Hello&lt;/p&gt;&lt;script&gt;alert(1)&lt;/script&gt;&lt;img src=x onerror=alert(1)&gt;</description>
+            </item></channel></rss>""",
+            """<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom News Feed</title><entry>
+                <title>Markup Article</title>
+                <link href="https://news.example.com/markup"/>
+                <summary type="html">&lt;p&gt;Hello&lt;/p&gt;&lt;script&gt;alert(1)&lt;/script&gt;&lt;img src=x onerror=alert(1)&gt;</summary>
+            </entry></feed>""",
+        ],
+        ids=["rss", "atom"],
+    )
+    def test_rss_fetcher_sanitizes_markup_like_feedparser(self, rss_fetcher, feed_text):
+        """Test that the XML fast path and the feedparser fallback store the same raw_text"""
+        fast = rss_fetcher._parse_feed("https://example.com/feed.rss", feed_text)
+        with patch.object(rss_fetcher, "_parse_feed_etree", return_value=None):
+            fallback = rss_fetcher._parse_feed("https://example.com/feed.rss", feed_text)
+
+        assert fast[0].raw_text == fallback[0].raw_text == '<p>Hello</p><img src="x" />'
+
     @pytest.mark.asyncio
     async def test_rss_fetcher_handles_feed_errors_gracefully(self):
         """Test that RSSFetcher handles HTTP errors without crashing"""
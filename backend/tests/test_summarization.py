@@ -2,12 +2,22 @@ import os
 from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
+import pytest
 
+from veritas_news.api import routes_bias_ratings
 from veritas_news.main import app
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def clear_summary_cache():
+    """Start every test with an empty /summarize cache"""
+    routes_bias_ratings._summary_cache.clear()
+    yield
+    routes_bias_ratings._summary_cache.clear()
+
+
 class TestSummarizationEndpoint:
     """Tests for the /bias_ratings/summarize endpoint"""
 
@@ -56,6 +66,36 @@ class TestSummarizationEndpoint:
             if "GEMINI_API_KEY" in os.environ:
                 del os.environ["GEMINI_API_KEY"]
 
+    @patch("veritas_news.ai.summarization.genai.Client")
+    def test_summarize_cached_by_article_text(self, mock_client_class):
+        """Test repeat submissions hit the cache unless X-No-Cache is sent"""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_result = MagicMock()
+        mock_result.text = "Cached summary."
+        mock_client.models.generate_content.return_value = mock_result
+
+        os.environ["GEMINI_API_KEY"] = "test_key"
+        payload = {"article_text": "An article that gets submitted more than once."}
+
+        try:
+            first = client.post("/bias_ratings/summarize", json=payload)
+            second = client.post("/bias_ratings/summarize", json=payload)
+
+            assert first.json() == second.json() == {"summary": "Cached summary."}
+            assert mock_client.models.generate_content.call_count == 1
+
+            bypass = client.post(
+                "/bias_ratings/summarize", json=payload, headers={"X-No-Cache": "1"}
+            )
+
+            assert bypass.status_code == 200
+            assert mock_client.models.generate_content.call_count == 2
+        finally:
+            if "GEMINI_API_KEY" in os.environ:
+                del os.environ["GEMINI_API_KEY"]
+
     @patch("veritas_news.ai.summarization.genai.Client")
     def test_summarize_gemini_api_error(self, mock_client_class):
         """Test graceful handling when Gemini API raises error"""
@@ -97,6 +137,85 @@ class TestSummarizationEndpoint:
                 os.environ["GEMINI_API_KEY"] = original_key
 
 
+class TestSummarizeBatchEndpoint:
+    """Tests for the /bias_ratings/summarize_batch endpoint"""
+
+    def test_summarize_batch_rejects_empty_batch(self):
+        """Test that an empty list of texts returns 422"""
+        response = client.post(
+            "/bias_ratings/summarize_batch", json={"article_texts": []}
+        )
+        assert response.status_code == 422
+
+    def test_summarize_batch_rejects_blank_text(self):
+        """Test that a whitespace-only text in the batch returns 422"""
+        response = client.post(
+            "/bias_ratings/summarize_batch",
+            json={"article_texts": ["Real article text.", "   "]},
+        )
+        assert response.status_code == 422
+
+    @patch("veritas_news.ai.summarization.genai.Client")
+    def test_summarize_batch_success(self, mock_client_class):
+        """Test summaries come back in order and duplicate texts are sent once"""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+
+        mock_result = MagicMock()
+        mock_result.text = "Batch summary."
+        mock_client.models.generate_content.return_value = mock_result
+
+        os.environ["GEMINI_API_KEY"] = "test_key"
+
+        try:
+            response = client.post(
+                "/bias_ratings/summarize_batch",
+                json={"article_texts": ["First article.", "Second.", "First article."]},
+            )
+
+            assert response.status_code == 200
+            assert response.json() == {"summaries": ["Batch summary."] * 3}
+            assert mock_client.models.generate_content.call_count == 2
+        finally:
+            if "GEMINI_API_KEY" in os.environ:
+                del os.environ["GEMINI_API_KEY"]
+
+    @patch("veritas_news.ai.summarization.genai.Client")
+    def test_summarize_batch_failure_yields_none(self, mock_client_class):
+        """Test an upstream failure gives None for that text, not a failed batch"""
+        mock_client = MagicMock()
+        mock_client_class.return_value = mock_client
+        mock_client.models.generate_content.side_effect = Exception("API timeout")
+
+        os.environ["GEMINI_API_KEY"] = "test_key"
+
+        try:
+            response = client.post(
+                "/bias_ratings/summarize_batch",
+                json={"article_texts": ["Sample article text for summarization."]},
+            )
+
+            assert response.status_code == 200
+            assert response.json() == {"summaries": [None]}
+        finally:
+            if "GEMINI_API_KEY" in os.environ:
+                del os.environ["GEMINI_API_KEY"]
+
+
+    @patch("veritas_news.ai.summarization.genai.Client")
+    def test_summarize_batch_missing_api_key(self, mock_client_class):
+        """Test that a missing API key fails the batch before any Gemini call"""
+        os.environ.pop("GEMINI_API_KEY", None)
+
+        response = client.post(
+            "/bias_ratings/summarize_batch",
+            json={"article_texts": ["First article.", "Second article."]},
+        )
+
+        assert response.status_code == 500
+        mock_client_class.assert_not_called()
+
+
 class TestSummarizationIntegration:
     """Integration tests for summarization with the full API"""
 
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Storage tests for the article pipeline - batch dedup, per-row fallback and caching.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from veritas_news.db.sqlalchemy import Base
+from veritas_news.models import sqlalchemy_models  # noqa: F401
+from veritas_news.worker import pipeline as pipeline_module
+from veritas_news.worker.fetchers import ArticleData
+from veritas_news.worker.pipeline import ArticlePipeline
+
+
+def make_article(n: int, **overrides) -> ArticleData:
+    """Build a distinct test article; overrides replace individual fields"""
+    fields = {
+        "title": f"Pipeline Article {n}",
+        "source": "Test",
+        "url": f"https://test.com/pipeline-{n}",
+        "raw_text": f"Content {n}",
+    }
+    fields.update(overrides)
+    return ArticleData(**fields)
+
+
+class TestPipelineStorage:
+    """Pipeline batch storage against a temporary database"""
+
+    @pytest.fixture
+    def temp_engine(self, monkeypatch):
+        """Point the pipeline's engine and raw connections at a temporary database"""
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        monkeypatch.setenv("DB_PATH", path)
+
+        engine = create_engine(
+            f"sqlite:///{path}", connect_args={"check_same_thread": False}
+        )
+        Base.metadata.create_all(bind=engine)
+
+        # The pipeline binds the shared engine at import time
+        monkeypatch.setattr(pipeline_module, "engine", engine)
+        monkeypatch.setattr(
+            pipeline_module, "get_raw_connection", engine.raw_connection
+        )
+
+        yield engine
+
+        engine.dispose()
+        if os.path.exists(path):
+            os.unlink(path)
+
+    @pytest.fixture
+    def pipeline(self, temp_engine):
+        return ArticlePipeline()
+
+    def stored_urls(self, engine) -> list[str]:
+        with engine.connect() as conn:
+            return list(conn.scalars(text("SELECT url FROM articles ORDER BY url")))
+
+    @pytest.mark.asyncio
+    async def test_stores_new_articles(self, pipeline, temp_engine):
+        """Test that every new article is stored and its id returned"""
+        articles = [make_article(i) for i in range(3)]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 3
+        assert len(self.stored_urls(temp_engine)) == 3
+
+    @pytest.mark.asyncio
+    async def test_in_batch_repeat_by_url(self, pipeline, temp_engine):
+        """Test that a URL repeated within one batch is stored once"""
+        articles = [make_article(1), make_article(2, url="https://test.com/pipeline-1")]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 1
+        assert self.stored_urls(temp_engine) == ["https://test.com/pipeline-1"]
+
+    @pytest.mark.asyncio
+    async def test_in_batch_repeat_by_title(self, pipeline, temp_engine):
+        """Test that a title repeated within one batch under a new URL is stored once"""
+        articles = [make_article(1), make_article(2, title="Pipeline Article 1")]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 1
+        assert self.stored_urls(temp_engine) == ["https://test.com/pipeline-1"]
+
+    @pytest.mark.asyncio
+    async def test_url_already_stored(self, pipeline, temp_engine):
+        """Test that a URL stored by another process is skipped by the INSERT"""
+        await ArticlePipeline().process_articles([make_article(1)])
+
+        # Same URL, new title: passes the title lookup and the in-memory URL check
+        stored_ids = await pipeline.process_articles(
+            [make_article(1, title="Retitled"), make_article(2)]
+        )
+
+        assert len(stored_ids) == 1
+        assert len(self.stored_urls(temp_engine)) == 2
+
+    @pytest.mark.asyncio
+    async def test_bad_row_does_not_drop_batch(self, pipeline, temp_engine):
+        """Test that one failing row is retried alone and the rest still commit"""
+        with temp_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TRIGGER reject_bad_title BEFORE INSERT ON articles "
+                    "WHEN NEW.title = 'Bad Article' "
+                    "BEGIN SELECT RAISE(ABORT, 'bad row'); END"
+                )
+            )
+        articles = [
+            make_article(1),
+            make_article(2, title="Bad Article"),
+            make_article(3),
+        ]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 2
+        assert self.stored_urls(temp_engine) == [
+            "https://test.com/pipeline-1",
+            "https://test.com/pipeline-3",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_bad_row_on_later_page(self, pipeline, temp_engine, monkeypatch):
+        """Test that rows from pages before a failing one keep their ids"""
+        monkeypatch.setattr(pipeline_module, "INSERT_PAGE_ROWS", 2)
+        messages = []
+        monkeypatch.setattr(pipeline_module.logger, "info", messages.append)
+        with temp_engine.begin() as conn:
+            conn.execute(
+                text(
+                    "CREATE TRIGGER reject_bad_title BEFORE INSERT ON articles "
+                    "WHEN NEW.title = 'Bad Article' "
+                    "BEGIN SELECT RAISE(ABORT, 'bad row'); END"
+                )
+            )
+        articles = [
+            make_article(1),
+            make_article(2),
+            make_article(3, title="Bad Article"),
+            make_article(4),
+        ]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 3
+        assert len(self.stored_urls(temp_engine)) == 3
+        assert messages[-1] == "Processing complete: 3 new, 0 duplicates, 1 errors"
+
+    @pytest.mark.asyncio
+    async def test_summary_counts(self, pipeline, temp_engine, monkeypatch):
+        """Test the stored/duplicate/error counts in the completion log"""
+        messages = []
+        monkeypatch.setattr(pipeline_module.logger, "info", messages.append)
+        await pipeline.process_articles([make_article(1)])
+
+        articles = [
+            make_article(1),  # already processed
+            make_article(2),
+            make_article(3, url="https://test.com/pipeline-2"),  # repeat by URL
+            make_article(4, title="Pipeline Article 2"),  # repeat by title
+            make_article(5, title=None),  # cannot be normalized
+        ]
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert len(stored_ids) == 1
+        assert messages[-1] == "Processing complete: 1 new, 3 duplicates, 1 errors"
+
+    @pytest.mark.asyncio
+    async def test_failed_transaction_counts_candidates(
+        self, pipeline, temp_engine, monkeypatch
+    ):
+        """Test that a rolled-back batch reports every candidate as an error"""
+        messages = []
+        monkeypatch.setattr(pipeline_module.logger, "info", messages.append)
+
+        def fail_store(conn, articles):
+            raise RuntimeError("store failed")
+
+        monkeypatch.setattr(pipeline, "_store_articles", fail_store)
+        articles = [
+            make_article(1),
+            make_article(2),
+            make_article(3, url="https://test.com/pipeline-1"),  # repeat by URL
+        ]
+
+        stored_ids = await pipeline.process_articles(articles)
+
+        assert stored_ids == []
+        assert self.stored_urls(temp_engine) == []
+        assert not pipeline._processed_urls
+        assert messages[-1] == "Processing complete: 0 new, 1 duplicates, 2 errors"
+
+    @pytest.mark.asyncio
+    async def test_store_invalidates_read_cache(self, pipeline, temp_engine):
+        """Test that cached counts and recent articles are dropped after a store"""
+        assert pipeline.get_article_count() == 0
+        assert pipeline.get_recent_articles() == []
+
+        await pipeline.process_articles([make_article(1)])
+
+        assert pipeline.get_article_count() == 1
+        assert len(pipeline.get_recent_articles()) == 1
+
+    @pytest.mark.asyncio
+    async def test_processed_urls_evicts_oldest(
+        self, pipeline, temp_engine, monkeypatch
+    ):
+        """Test that the in-memory URL set keeps only the newest PROCESSED_URLS_MAX"""
+        monkeypatch.setattr(pipeline_module, "PROCESSED_URLS_MAX", 2)
+
+        await pipeline.process_articles([make_article(1)])
+        await pipeline.process_articles([make_article(2), make_article(3)])
+
+        assert list(pipeline._processed_urls) == [
+            "https://test.com/pipeline-2",
+            "https://test.com/pipeline-3",
+        ]